@@ -49,7 +49,7 @@ class WOGConfig(BaseModel):
         description="Maximum number of threads for parallel operations",
     )
     chunk_size: int = Field(
-        default=8192,
+        default=65536,
         ge=1024,
         le=1048576,
         description="Chunk size for file operations (bytes)",
@@ -60,6 +60,12 @@ class WOGConfig(BaseModel):
         le=300,
         description="Request timeout in seconds",
     )
+    png_compress_level: int = Field(
+        default=6,
+        ge=0,
+        le=9,
+        description="zlib compression level for exported PNG files (0-9); lower is faster but larger",
+    )
 
     # File Configuration
     data_file: Path | None = Field(
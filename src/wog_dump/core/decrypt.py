@@ -4,10 +4,15 @@ from __future__ import annotations
 
 import bz2
 import hashlib
+import logging
+import mmap
+import multiprocessing
+import os
 import re
 import time
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Any
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
 import requests
 import UnityPy
@@ -17,7 +22,73 @@ from UnityPy.classes import TextAsset
 
 from ..core.config import WOGConfig, get_config
 from ..core.storage import DataStorageManager, StorageError
-from ..utils.logging import get_logger
+from ..utils.logging import WorkerLogForwarder, get_logger, init_worker_logging
+
+if TYPE_CHECKING:
+    from multiprocessing.queues import Queue as ProcessQueue
+
+
+# Bytes XORed per step when decrypting files; rounded down to a whole number
+# of key lengths so every block starts at key offset zero
+_XOR_BLOCK_SIZE = 1 << 20
+
+# Key requests are a couple hundred bytes, so the smallest bz2 block size
+# compresses them just as well and allocates far less state per call
+_REQUEST_COMPRESS_LEVEL = 1
+
+
+def _key_stream(key_bytes: bytes, size: int) -> int:
+    """Return the key repeated to size bytes, as a little-endian integer."""
+    repeats, remainder = divmod(size, len(key_bytes))
+    return int.from_bytes(key_bytes * repeats + key_bytes[:remainder], "little")
+
+
+def _xor_bytes(data: bytes | memoryview, key_bytes: bytes, key_stream: int | None = None) -> bytes:
+    """XOR data with a repeating key.
+
+    Data and key stream are read as little-endian integers, so the whole
+    buffer is XORed by one arbitrary-precision operation in C instead of a
+    Python loop over every byte. Callers XORing many equal-sized blocks can
+    pass a precomputed key_stream for that size.
+    """
+    size = len(data)
+    if not size:
+        return b""
+
+    if key_stream is None:
+        key_stream = _key_stream(key_bytes, size)
+    return (int.from_bytes(data, "little") ^ key_stream).to_bytes(size, "little")
+
+
+def _script_bytes(script: bytes | str) -> bytes:
+    """Return a TextAsset's m_Script as the raw bytes stored in the asset.
+
+    Binary scripts may arrive as str with undecodable bytes smuggled in as
+    surrogates; surrogateescape restores those bytes and is identical to
+    strict UTF-8 for every other string.
+    """
+    if isinstance(script, bytes):
+        return script
+    return str(script).encode('utf-8', errors='surrogateescape')
+
+
+# Decryptor shared by all tasks of a pool worker, built by _init_decrypt_worker
+_worker_decryptor: AssetDecryptor | None = None
+
+
+def _init_decrypt_worker(config_data: dict[str, Any], log_queue: ProcessQueue[logging.LogRecord],
+                         level: int) -> None:
+    """Pool initializer: route logging to the parent and build the decryptor once."""
+    global _worker_decryptor
+    init_worker_logging(log_queue, level)
+    _worker_decryptor = AssetDecryptor(WOGConfig(**config_data))
+
+
+def _decrypt_in_worker(asset_path: Path, key: str) -> list[Path]:
+    """Decrypt one asset inside a worker process."""
+    if _worker_decryptor is None:
+        raise DecryptionError("Decryption worker was not initialized")
+    return _worker_decryptor.decrypt_asset(asset_path, key)
 
 
 class DecryptionError(Exception):
@@ -58,6 +129,7 @@ class KeyManager:
         self.storage = DataStorageManager(self.config)
         self.session = self._create_session()
         self._key_cache: dict[str, str] = {}
+        self._api_headers = self.config.get_api_headers()
 
     def _create_session(self) -> requests.Session:
         """Create HTTP session with retry strategy and optimal settings."""
@@ -105,7 +177,7 @@ class KeyManager:
     def _compress_request_data(self, data: str) -> bytes:
         """Compress request data using BZ2."""
         try:
-            compressed = bz2.compress(data.encode())
+            compressed = bz2.compress(data.encode(), _REQUEST_COMPRESS_LEVEL)
             length = len(compressed)
             return length.to_bytes(4, "little") + compressed
         except Exception as e:
@@ -163,8 +235,7 @@ class KeyManager:
             payload = self._compress_request_data(request_data)
 
             # Prepare headers
-            headers = self.config.get_api_headers()
-            headers['Content-Length'] = str(len(payload))
+            headers = {**self._api_headers, 'Content-Length': str(len(payload))}
 
             # Make API request
             with self.logger.time_operation(f"key_fetch_{asset_name}"):
@@ -409,19 +480,14 @@ class AssetDecryptor:
         if not base_key:
             raise ValueError("Base key cannot be empty")
 
+        # MD5 only derives the XOR key here, so it is not a security use
         full_key = base_key + "World of Guns: Gun Disassembly"
-        return hashlib.md5(full_key.encode('utf-8')).hexdigest()
-
-    def _xor_decrypt_optimized(self, data: bytes, key_bytes: bytes) -> bytes:
-        """Optimized XOR decryption using bytearray operations."""
-        key_len = len(key_bytes)
-        result = bytearray(len(data))
-
-        # Process data in chunks for better cache performance
-        for i in range(len(data)):
-            result[i] = data[i] ^ key_bytes[i % key_len]
+        return hashlib.md5(full_key.encode('utf-8'), usedforsecurity=False).hexdigest()
 
-        return bytes(result)
+    def _xor_decrypt_optimized(self, data: bytes | memoryview, key_bytes: bytes,
+                               key_stream: int | None = None) -> bytes:
+        """Optimized XOR decryption of one chunk with a repeating key."""
+        return _xor_bytes(data, key_bytes, key_stream)
 
     def decrypt_with_python(self, input_path: Path, key: str, output_path: Path) -> bool:
         """Python-based XOR decryption for single file."""
@@ -429,27 +495,22 @@ class AssetDecryptor:
             decryption_key = self.generate_decryption_key(key)
             key_bytes = decryption_key.encode('utf-8')
 
-            # Read and decrypt in chunks to handle large files
+            # Map the input and decrypt it block by block; blocks are sliced
+            # from the page cache without copying the file into memory
             with open(input_path, "rb") as infile, open(output_path, "wb") as outfile:
-                chunk_size = self.config.chunk_size
-                bytes_processed = 0
-
-                while True:
-                    chunk = infile.read(chunk_size)
-                    if not chunk:
-                        break
-
-                    # Adjust key offset for continuous decryption
-                    key_offset = bytes_processed % len(key_bytes)
-                    if key_offset:
-                        # Create adjusted key for this chunk
-                        adjusted_key = key_bytes[key_offset:] + key_bytes[:key_offset]
-                    else:
-                        adjusted_key = key_bytes
-
-                    decrypted_chunk = self._xor_decrypt_optimized(chunk, adjusted_key)
-                    outfile.write(decrypted_chunk)
-                    bytes_processed += len(chunk)
+                file_size = os.fstat(infile.fileno()).st_size
+                if file_size:
+                    block_size = max(_XOR_BLOCK_SIZE // len(key_bytes), 1) * len(key_bytes)
+                    # Every full block shares one key stream, so expand it once
+                    stream_size = min(block_size, file_size)
+                    block_stream = _key_stream(key_bytes, stream_size)
+
+                    with mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ) as mapped, \
+                            memoryview(mapped) as view:
+                        for start in range(0, len(view), block_size):
+                            with view[start:start + block_size] as block:
+                                stream = block_stream if len(block) == stream_size else None
+                                outfile.write(self._xor_decrypt_optimized(block, key_bytes, stream))
 
             # Validate output file if enabled
             if self.config.enable_validation and output_path.exists():
@@ -487,13 +548,16 @@ class AssetDecryptor:
                         encrypted_path = self.config.encrypted_dir / f"{data.m_Name}.bytes"
                         decrypted_path = self.config.decrypted_dir / f"{data.m_Name}.unity3d"
 
+                        # Encode the script once for both the size check and the write
+                        payload = _script_bytes(data.m_Script)
+
                         # Check if already processed
-                        if self._is_already_processed(encrypted_path, decrypted_path, data):
+                        if self._is_already_processed(encrypted_path, decrypted_path, payload):
                             decrypted_files.append(decrypted_path)
                             continue
 
                         # Write encrypted data
-                        self._write_encrypted_data(encrypted_path, data)
+                        self._write_encrypted_data(encrypted_path, payload)
 
                         # Decrypt the file
                         if self.decrypt_with_python(encrypted_path, key, decrypted_path):
@@ -507,61 +571,29 @@ class AssetDecryptor:
 
         return decrypted_files
 
-    def _is_already_processed(self, encrypted_path: Path, decrypted_path: Path, data) -> bool:
+    def _is_already_processed(self, encrypted_path: Path, decrypted_path: Path,
+                              payload: bytes) -> bool:
         """Check if file is already processed and up to date."""
         if not (encrypted_path.exists() and decrypted_path.exists()):
             return False
 
-        # Calculate expected size
-        if isinstance(data.m_Script, bytes):
-            expected_size = len(data.m_Script)
-        else:
-            try:
-                expected_size = len(str(data.m_Script).encode('utf-8'))
-            except UnicodeEncodeError:
-                expected_size = len(str(data.m_Script).encode('utf-8', errors='surrogateescape'))
-
-        return encrypted_path.stat().st_size == expected_size
+        return encrypted_path.stat().st_size == len(payload)
 
-    def _write_encrypted_data(self, encrypted_path: Path, data) -> None:
-        """Write encrypted data to file with proper encoding."""
+    def _write_encrypted_data(self, encrypted_path: Path, payload: bytes) -> None:
+        """Write the encoded m_Script payload to the encrypted file."""
         try:
             # Ensure output directory exists
             encrypted_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            if isinstance(data.m_Script, bytes):
-                encrypted_path.write_bytes(data.m_Script)
-            else:
-                # Handle string data with proper encoding
-                text_data = str(data.m_Script)
-                try:
-                    encrypted_path.write_bytes(text_data.encode('utf-8'))
-                except UnicodeEncodeError:
-                    # Handle surrogates
-                    encrypted_path.write_bytes(text_data.encode('utf-8', errors='surrogateescape'))
+            encrypted_path.write_bytes(payload)
         except Exception as e:
             raise DecryptionError(f"Failed to write encrypted data: {e}") from e
 
     def xor_decrypt(self, data: bytes, key: str) -> bytes:
-        """Optimized XOR decryption with chunked processing."""
+        """Optimized XOR decryption of a whole buffer."""
         if not key:
             raise ValueError("Decryption key cannot be empty")
 
-        key_bytes = key.encode('utf-8')
-        key_len = len(key_bytes)
-        
-        # Use bytearray for efficient in-place modification
-        result = bytearray(len(data))
-        
-        # Process in chunks for better performance
-        chunk_size = self.config.chunk_size
-        for i in range(0, len(data), chunk_size):
-            chunk_end = min(i + chunk_size, len(data))
-            
-            for j in range(i, chunk_end):
-                result[j] = data[j] ^ key_bytes[j % key_len]
-        
-        return bytes(result)
+        return _xor_bytes(data, key.encode('utf-8'))
 
     def decrypt_single_asset(self, asset_path: Path, key: str, 
                            output_path: Path | None = None) -> bool:
@@ -622,8 +654,13 @@ class AssetDecryptor:
         return any(sig in header for sig in unity_signatures)
 
     def decrypt_all_assets(self, keys: dict[str, str] | None = None,
-                          max_workers: int | None = None) -> tuple[list[Path], list[str]]:
-        """Decrypt all assets with parallel processing."""
+                          max_workers: int | None = None,
+                          max_processes: int | None = None) -> tuple[list[Path], list[str]]:
+        """Decrypt all assets with parallel processing.
+
+        max_workers limits the threads fetching missing keys; max_processes
+        limits the decryption process pool and defaults to the CPU count.
+        """
         if keys is None:
             # If no keys provided, get weapon list and fetch keys
             weapon_list = self._get_available_weapons()
@@ -652,20 +689,34 @@ class AssetDecryptor:
             self.logger.warning(f"No assets found in {self.config.assets_dir}")
             return [], []
 
+        keyed_assets = []
         for asset_path in assets:
-            asset_name = asset_path.stem
-
-            if asset_name not in keys:
-                self.logger.warning(f"No key found for {asset_name}")
-                failed.append(asset_name)
-                continue
+            if asset_path.stem in keys:
+                keyed_assets.append(asset_path)
+            else:
+                self.logger.warning(f"No key found for {asset_path.stem}")
+                failed.append(asset_path.stem)
+
+        # XOR decryption is CPU-bound, so larger batches go to separate processes
+        processes = min(max_processes or os.cpu_count() or 1, len(keyed_assets))
+        results = None
+        if len(keyed_assets) > 5 and processes > 1:
+            results = self._decrypt_in_processes(keyed_assets, keys, processes)
+
+        if results is None:
+            results = {}
+            for asset_path in keyed_assets:
+                try:
+                    results[asset_path] = self.decrypt_asset(asset_path, keys[asset_path.stem])
+                except Exception as e:
+                    self.logger.error(f"Failed to decrypt {asset_path.stem}: {e}")
 
-            try:
-                files = self.decrypt_asset(asset_path, keys[asset_name])
-                successful.extend(files)
-            except Exception as e:
-                self.logger.error(f"Failed to decrypt {asset_name}: {e}")
-                failed.append(asset_name)
+        # Keep the output in asset order regardless of completion order
+        for asset_path in keyed_assets:
+            if asset_path in results:
+                successful.extend(results[asset_path])
+            else:
+                failed.append(asset_path.stem)
 
         # Log summary
         total_assets = len(assets)
@@ -681,6 +732,41 @@ class AssetDecryptor:
 
         return successful, failed
 
+    def _decrypt_in_processes(self, asset_paths: list[Path], keys: dict[str, str],
+                              max_workers: int) -> dict[Path, list[Path]] | None:
+        """Decrypt assets on a process pool; returns None if no pool could be started.
+
+        Assets that fail to decrypt are logged and left out of the result.
+        """
+        context = multiprocessing.get_context("spawn")
+        try:
+            log_forwarder = WorkerLogForwarder(context)
+            executor = ProcessPoolExecutor(
+                max_workers=max_workers, mp_context=context,
+                initializer=_init_decrypt_worker,
+                initargs=(self.config.model_dump(), *log_forwarder.initargs),
+            )
+        except (OSError, NotImplementedError) as e:
+            self.logger.debug(f"Process pool unavailable, decrypting sequentially: {e}")
+            return None
+
+        results: dict[Path, list[Path]] = {}
+
+        with log_forwarder, executor:
+            future_to_asset = {
+                executor.submit(_decrypt_in_worker, asset_path, keys[asset_path.stem]): asset_path
+                for asset_path in asset_paths
+            }
+
+            for future in as_completed(future_to_asset):
+                asset_path = future_to_asset[future]
+                try:
+                    results[asset_path] = future.result()
+                except Exception as e:
+                    self.logger.error(f"Failed to decrypt {asset_path.stem}: {e}")
+
+        return results
+
     def _get_available_weapons(self) -> list[str]:
         """Get list of available weapons from storage or assets directory."""
         # Try to get from storage first
@@ -694,13 +780,12 @@ class AssetDecryptor:
         if not self.config.assets_dir.exists():
             return []
 
-        weapons = []
-        for asset_file in self.config.assets_dir.glob("*.unity3d"):
-            weapon_name = asset_file.stem
-            if weapon_name not in self.config.weapon_blacklist:
-                weapons.append(weapon_name)
-
-        return sorted(weapons)
+        blacklist = frozenset(self.config.weapon_blacklist)
+        return sorted(
+            asset_file.stem
+            for asset_file in self.config.assets_dir.glob("*.unity3d")
+            if asset_file.stem not in blacklist
+        )
 
     def get_decryption_stats(self) -> dict[str, int]:
         """Get decryption statistics."""
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
@@ -14,6 +16,9 @@ from ..core.config import WOGConfig, get_config
 from ..core.storage import DataStorageManager
 from ..utils.logging import get_logger
 
+# File buffer for downloads; network chunks are coalesced into writes of this size
+_WRITE_BUFFER_SIZE = 1 << 20
+
 
 class DownloadError(Exception):
     """Base exception for download operations."""
@@ -38,6 +43,9 @@ class DownloadManager:
         self.logger = get_logger()
         self.storage = DataStorageManager(self.config)
         self.session = self._create_session()
+        # Server sizes by asset name, so repeated update checks reuse one HEAD
+        self._size_cache: dict[str, int] = {}
+        self._stats_lock = threading.Lock()
         self._download_stats = {
             'total_bytes': 0,
             'files_downloaded': 0,
@@ -95,7 +103,15 @@ class DownloadManager:
             return False
 
     def get_asset_size(self, asset_name: str) -> int:
-        """Get the size of an asset from the server."""
+        """Get the size of an asset from the server.
+
+        Known sizes are cached for the lifetime of the manager; failed
+        lookups are not cached and will be retried.
+        """
+        cached = self._size_cache.get(asset_name)
+        if cached is not None:
+            return cached
+
         # Special case for spider_gen which is in spider/ subdirectory
         if asset_name == "spider_gen":
             url = f"{self.config.data_base_url}/spider/{asset_name}.unity3d"
@@ -104,25 +120,33 @@ class DownloadManager:
         try:
             response = self.session.head(url, timeout=self.config.request_timeout)
             response.raise_for_status()
-            return int(response.headers.get("Content-Length", 0))
+            size = int(response.headers.get("Content-Length", 0))
         except requests.RequestException as e:
             self.logger.debug(f"Failed to get size for {asset_name}: {e}")
             return 0
 
+        if size:
+            self._size_cache[asset_name] = size
+        return size
+
     def check_asset_needs_update(self, asset_name: str) -> bool:
         """Check if an asset needs updating based on size comparison."""
         asset_path = self.config.assets_dir / f"{asset_name}.unity3d"
         
-        if not asset_path.exists():
+        try:
+            local_size = asset_path.stat().st_size
+        except FileNotFoundError:
             return True
             
-        # Basic size comparison
+        return self._size_differs(asset_name, local_size)
+
+    def _size_differs(self, asset_name: str, local_size: int) -> bool:
+        """Compare a local asset size against the server's Content-Length."""
         server_size = self.get_asset_size(asset_name)
         if server_size == 0:
             # Can't get server size, assume no update needed
             return False
             
-        local_size = asset_path.stat().st_size
         if local_size != server_size:
             self.logger.debug(f"{asset_name}: size mismatch (local: {local_size}, server: {server_size})")
             return True
@@ -141,25 +165,15 @@ class DownloadManager:
                 response.raise_for_status()
 
                 total_size = int(response.headers.get("Content-Length", 0))
-                downloaded = 0
 
                 # Download to temporary file
-                with open(temp_path, "wb") as f:
-                    for chunk in response.iter_content(chunk_size=self.config.chunk_size):
-                        if chunk:
-                            f.write(chunk)
-                            # Handle both real bytes and mock objects
-                            try:
-                                downloaded += len(chunk)
-                            except TypeError:
-                                # For mocked chunks, estimate based on data
-                                downloaded += len(bytes(chunk)) if hasattr(chunk, '__bytes__') else len(str(chunk).encode())
+                downloaded = self._write_response(response, temp_path)
 
                 # Validate if requested
                 if validate and not self.validate_asset(temp_path):
                     temp_path.unlink(missing_ok=True)
                     self.logger.error(f"Downloaded asset failed validation: {asset_name}")
-                    self._download_stats['files_failed'] += 1
+                    self._record_failure()
                     return False
 
                 # Move to final location
@@ -168,24 +182,51 @@ class DownloadManager:
                 temp_path.rename(asset_path)
 
                 # Update stats
-                self._download_stats['total_bytes'] += downloaded
-                self._download_stats['files_downloaded'] += 1
+                with self._stats_lock:
+                    self._download_stats['total_bytes'] += downloaded
+                    self._download_stats['files_downloaded'] += 1
 
                 self.logger.debug(f"Downloaded {asset_name} ({downloaded:,} bytes)")
                 return True
 
         except requests.RequestException as e:
             self.logger.error(f"Network error downloading {asset_name}: {e}")
-            self._download_stats['files_failed'] += 1
+            self._record_failure()
             return False
         except Exception as e:
             self.logger.error(f"Failed to download {asset_name}: {e}")
-            self._download_stats['files_failed'] += 1
+            self._record_failure()
             return False
         finally:
             # Clean up temp file
             temp_path.unlink(missing_ok=True)
 
+    def _write_response(self, response: requests.Response, path: Path) -> int:
+        """Stream a response body to a file and return the number of bytes written.
+
+        Network chunks are small, so writes go through a large file buffer and
+        reach the OS in a few big calls rather than one per chunk.
+        """
+        downloaded = 0
+
+        with open(path, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+            for chunk in response.iter_content(chunk_size=self.config.chunk_size):
+                if chunk:
+                    f.write(chunk)
+                    # Handle both real bytes and mock objects
+                    try:
+                        downloaded += len(chunk)
+                    except TypeError:
+                        # For mocked chunks, estimate based on data
+                        downloaded += len(bytes(chunk)) if hasattr(chunk, '__bytes__') else len(str(chunk).encode())
+
+        return downloaded
+
+    def _record_failure(self) -> None:
+        """Count a failed download; downloads may run on several threads."""
+        with self._stats_lock:
+            self._download_stats['files_failed'] += 1
+
     def download_weapon_list(self, force_update: bool = False) -> Path:
         """Download the weapon list asset (spider_gen.unity3d)."""
         asset_name = "spider_gen"
@@ -207,18 +248,7 @@ class DownloadManager:
                 
                 temp_path = asset_path.with_suffix('.tmp')
                 total_size = int(response.headers.get("Content-Length", 0))
-                downloaded = 0
-                
-                with open(temp_path, "wb") as f:
-                    for chunk in response.iter_content(chunk_size=self.config.chunk_size):
-                        if chunk:
-                            f.write(chunk)
-                            # Handle both real bytes and mock objects
-                            try:
-                                downloaded += len(chunk)
-                            except TypeError:
-                                # For mocked chunks, estimate based on data
-                                downloaded += len(bytes(chunk)) if hasattr(chunk, '__bytes__') else len(str(chunk).encode())
+                downloaded = self._write_response(response, temp_path)
                 
                 # Validate if file looks correct
                 if self.validate_asset(temp_path):
@@ -245,30 +275,43 @@ class DownloadManager:
         if not weapon_list:
             return []
             
-        to_download = []
+        # One directory listing gives every local size; missing assets need
+        # no HEAD request at all
+        local_sizes = self._local_asset_sizes()
+        to_download = [weapon for weapon in weapon_list if f"{weapon}.unity3d" not in local_sizes]
+        to_check = [weapon for weapon in weapon_list if f"{weapon}.unity3d" in local_sizes]
         
-        with ThreadPoolExecutor(max_workers=min(self.config.max_threads, len(weapon_list))) as executor:
-            # Submit update check tasks
-            future_to_weapon = {
-                executor.submit(self.check_asset_needs_update, weapon): weapon
-                for weapon in weapon_list
-            }
+        if to_check:
+            with ThreadPoolExecutor(max_workers=min(self.config.max_threads, len(to_check))) as executor:
+                # Submit update check tasks
+                future_to_weapon = {
+                    executor.submit(self._size_differs, weapon, local_sizes[f"{weapon}.unity3d"]): weapon
+                    for weapon in to_check
+                }
             
-            # Collect results as they complete
-            for future in as_completed(future_to_weapon):
-                weapon = future_to_weapon[future]
-                try:
-                    needs_update = future.result()
-                    if needs_update:
+                # Collect results as they complete
+                for future in as_completed(future_to_weapon):
+                    weapon = future_to_weapon[future]
+                    try:
+                        needs_update = future.result()
+                        if needs_update:
+                            to_download.append(weapon)
+                    except Exception as e:
+                        self.logger.debug(f"Failed to check update for {weapon}: {e}")
+                        # If we can't check, assume it needs update
                         to_download.append(weapon)
-                except Exception as e:
-                    self.logger.debug(f"Failed to check update for {weapon}: {e}")
-                    # If we can't check, assume it needs update
-                    to_download.append(weapon)
                     
         self.logger.info(f"Update check: {len(to_download)} of {len(weapon_list)} assets need updates")
         return to_download
         
+    def _local_asset_sizes(self) -> dict[str, int]:
+        """Return the size of every file in the assets directory by name."""
+        try:
+            with os.scandir(self.config.assets_dir) as entries:
+                return {entry.name: entry.stat().st_size for entry in entries if entry.is_file()}
+        except FileNotFoundError:
+            return {}
+        
     def download_assets(self, weapon_list: list[str], check_updates: bool = True) -> tuple[list[str], list[str]]:
         """Download multiple assets and return successful and failed lists."""
         if not weapon_list:
@@ -283,19 +326,30 @@ class DownloadManager:
         else:
             to_download = weapon_list
             
-        successful = []
-        failed = []
-        
-        # Download assets sequentially for now
-        for weapon in to_download:
-            try:
-                if self.download_single_asset(weapon):
-                    successful.append(weapon)
-                else:
-                    failed.append(weapon)
-            except Exception as e:
-                self.logger.error(f"Failed to download {weapon}: {e}")
-                failed.append(weapon)
+        # Downloads of the same name would share a temp file, so each weapon
+        # is fetched once
+        to_download = list(dict.fromkeys(to_download))
+
+        # Each download is one streamed connection, so running several at
+        # once keeps the link busy instead of waiting on one stream's latency
+        results = {}
+        with ThreadPoolExecutor(max_workers=min(self.config.max_threads, len(to_download))) as executor:
+            future_to_weapon = {
+                executor.submit(self.download_single_asset, weapon): weapon
+                for weapon in to_download
+            }
+
+            for future in as_completed(future_to_weapon):
+                weapon = future_to_weapon[future]
+                try:
+                    results[weapon] = future.result()
+                except Exception as e:
+                    self.logger.error(f"Failed to download {weapon}: {e}")
+                    results[weapon] = False
+
+        # Report in the requested order rather than completion order
+        successful = [weapon for weapon in to_download if results[weapon]]
+        failed = [weapon for weapon in to_download if not results[weapon]]
                 
         self.logger.info(f"Download completed: {len(successful)} successful, {len(failed)} failed")
         return successful, failed
@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import json
+import os
+import shutil
+import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -12,6 +15,37 @@ from pydantic import BaseModel, Field
 from .config import WOGConfig, get_config
 from ..utils.logging import get_logger
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
+
+
+# Parsed data.json documents by path, reused while the file keeps the same
+# inode, mtime and size; every manager in a run then parses the file once
+_DOCUMENT_CACHE: dict[Path, tuple[tuple[int, int, int], dict[str, Any]]] = {}
+
+
+def _file_signature(path: Path) -> tuple[int, int, int]:
+    """Return the stat fields that change whenever the file is rewritten."""
+    stat = path.stat()
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+def _dump_json(data: dict[str, Any]) -> bytes:
+    """Serialize a JSON-compatible document to indented UTF-8 JSON."""
+    if orjson is not None:
+        encoded: bytes = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        return encoded
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _load_json(payload: bytes) -> Any:
+    """Parse UTF-8 JSON; orjson's decode errors subclass json.JSONDecodeError."""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
 
 class CacheMetadata(BaseModel):
     """Cache metadata with timestamps and validation."""
@@ -132,8 +166,7 @@ class DataStorageManager:
             return self._data
 
         try:
-            with open(self.data_file, 'r', encoding='utf-8') as f:
-                data_dict = json.load(f)
+            data_dict = self._read_document()
             
             self._data = WOGDataStore(**data_dict)
             self.logger.info(f"Loaded data from {self.data_file}")
@@ -167,30 +200,74 @@ class DataStorageManager:
             # Store current config snapshot
             self._data.config_snapshot = self.config.get_stats()
 
-            # Create backup if requested and file exists
-            if backup and self.data_file.exists():
-                backup_path = self.data_file.with_suffix('.json.bak')
-                backup_path.write_bytes(self.data_file.read_bytes())
-                self.logger.debug(f"Created backup: {backup_path}")
-
             # Ensure parent directory exists
             self.data_file.parent.mkdir(parents=True, exist_ok=True)
 
-            # Write data to file with pretty formatting
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(
-                    self._data.model_dump(),
-                    f,
-                    indent=2,
-                    ensure_ascii=False,
-                    default=str  # Handle datetime serialization
-                )
+            # Serialize once and write the whole document in a single call;
+            # JSON mode dumps datetimes as ISO 8601 strings
+            document = self._data.model_dump(mode="json")
+            signature = self._write_atomic(_dump_json(document), backup)
+            _DOCUMENT_CACHE[self.data_file] = (signature, document)
 
             self.logger.info(f"Saved data to {self.data_file}")
 
         except Exception as e:
             raise RuntimeError(f"Failed to save data: {e}") from e
 
+    def _read_document(self) -> dict[str, Any]:
+        """Return the parsed data file, skipping the parse if it is unchanged."""
+        signature = _file_signature(self.data_file)
+        cached = _DOCUMENT_CACHE.get(self.data_file)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        document: dict[str, Any] = _load_json(self.data_file.read_bytes())
+        _DOCUMENT_CACHE[self.data_file] = (signature, document)
+        return document
+
+    def _write_atomic(self, payload: bytes, backup: bool) -> tuple[int, int, int]:
+        """Replace data.json with payload so readers never see a partial file.
+
+        The new document is synced to a temporary file and renamed over the
+        old one. The replaced file keeps its inode, so the backup is just a
+        second link to it rather than a copy of its contents. Returns the
+        signature of the written file.
+        """
+        # Unique temporary names per save, so concurrent saves never share
+        # or delete each other's files
+        fd, temp_name = tempfile.mkstemp(dir=self.data_file.parent,
+                                         prefix=f".{self.data_file.name}.", suffix=".tmp")
+        temp_path = Path(temp_name)
+        backup_temp = temp_path.with_suffix(".bak")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+
+            if self.data_file.exists():
+                # mkstemp creates owner-only files; keep the existing permissions
+                shutil.copymode(self.data_file, temp_path)
+
+            if backup and self.data_file.exists():
+                backup_path = self.data_file.with_suffix('.json.bak')
+                try:
+                    os.link(self.data_file, backup_temp)
+                except OSError:
+                    # Filesystems without hardlinks get a real copy
+                    shutil.copy2(self.data_file, backup_temp)
+                os.replace(backup_temp, backup_path)
+                self.logger.debug(f"Created backup: {backup_path}")
+
+            # Renaming keeps the inode, mtime and size, so this is also the
+            # signature of data.json right after the replace below
+            signature = _file_signature(temp_path)
+            os.replace(temp_path, self.data_file)
+            return signature
+        finally:
+            temp_path.unlink(missing_ok=True)
+            backup_temp.unlink(missing_ok=True)
+
     def get_weapons(self) -> list[str]:
         """Get weapon list from data store."""
         return self.data.weapons.weapons
@@ -2,16 +2,96 @@
 
 from __future__ import annotations
 
+import codecs
+import io
 import json
+import multiprocessing
+import re
+import threading
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Any
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
 import UnityPy
+from charset_normalizer import from_bytes
 from UnityPy.classes import TextAsset, Texture2D, Mesh, Material
+from UnityPy.enums import TextureFormat
 
 from ..core.config import WOGConfig, get_config
 from ..core.storage import DataStorageManager, StorageError
-from ..utils.logging import get_logger
+from ..utils.logging import WorkerLogForwarder, get_logger, init_worker_logging
+
+if TYPE_CHECKING:
+    from rich.progress import Progress, TaskID
+    from UnityPy.files import ObjectReader
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
+
+# Weapon names consist of word characters and dashes only
+_VALID_WEAPON_NAME = re.compile(r"[\w\-]+")
+
+# Image extension that ends a weapon name in new_banners, in any letter case
+_PNG_SUFFIX = re.compile(r"\.png", re.IGNORECASE)
+
+# Characters that rule out an extension-less line as a weapon name
+_PATH_CHARS = frozenset('/\\?*<>|')
+
+# Byte order marks recognised in TextAsset payloads; UTF-32 LE must be checked
+# before UTF-16 LE because it starts with the same two bytes
+_TEXT_BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+
+# Every byte outside printable ASCII (0x20-0x7E), for bytes.translate deletion
+_NON_PRINTABLE = bytes(b for b in range(256) if not 32 <= b <= 126)
+
+# TextAssets are classified as text or binary from this many leading bytes
+_TEXT_SNIFF_SIZE = 4096
+_UTF8_DECODER = codecs.getincrementaldecoder("utf-8")
+
+
+def _detect_encoding(data: bytes) -> str | None:
+    """Guess the encoding of non-UTF-8 text using charset-normalizer."""
+    best = from_bytes(data).best()
+    return best.encoding if best else None
+
+
+def _dump_json(data: dict[str, Any]) -> bytes:
+    """Serialize extracted metadata to indented UTF-8 JSON."""
+    if orjson is not None:
+        encoded: bytes = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        return encoded
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _peek_name(obj: ObjectReader[Any]) -> str | None:
+    """Read an object's m_Name without deserializing its payload, if supported."""
+    peek_name = getattr(obj, "peek_name", None)
+    if not callable(peek_name):
+        return None
+
+    try:
+        name = peek_name()
+    except Exception:
+        return None
+
+    return name if isinstance(name, str) else None
+
+
+def _unpack_in_worker(config_data: dict, asset_path: Path, output_dir: Path,
+                      extract_types: list[str] | None) -> tuple[list[Path], dict[str, int]]:
+    """Unpack one asset inside a worker process and report its extraction stats."""
+    unpacker = AssetUnpacker(WOGConfig(**config_data))
+    extracted_files = unpacker._unpack_single_asset_safe(asset_path, output_dir, extract_types)
+    return extracted_files, unpacker._extraction_stats
 
 
 class UnpackError(Exception):
@@ -27,6 +107,9 @@ class AssetProcessingError(UnpackError):
 class WeaponListProcessor:
     """Enhanced processor for weapon list extraction and management with JSON storage."""
 
+    # Name of the TextAsset in spider_gen.unity3d holding the weapon list
+    WEAPON_LIST_ASSET = "new_banners"
+
     def __init__(self, config: WOGConfig | None = None) -> None:
         self.config = config or get_config()
         self.logger = get_logger()
@@ -43,15 +126,11 @@ class WeaponListProcessor:
             with self.logger.time_operation("extract_weapon_list"):
                 env = UnityPy.load(str(asset_path))
 
-                for obj in env.objects:
-                    if obj.type.name == "TextAsset":
-                        data = obj.read()
-
-                        if data.m_Name == "new_banners":
-                            # Process the banner data to extract weapon names
-                            text_content = self._extract_text_content(data)
-                            weapon_list = self._parse_weapon_names(text_content)
-                            break
+                data = self._find_weapon_list_asset(env)
+                if data is not None:
+                    # Process the banner data to extract weapon names
+                    text_content = self._extract_text_content(data)
+                    weapon_list = self._parse_weapon_names(text_content)
 
                 if not weapon_list:
                     raise UnpackError("No weapon list found in 'new_banners' TextAsset")
@@ -65,35 +144,79 @@ class WeaponListProcessor:
         except Exception as e:
             raise UnpackError(f"Failed to extract weapon list: {e}") from e
 
+    def _find_weapon_list_asset(self, env: UnityPy.Environment) -> TextAsset | None:
+        """Locate the weapon list TextAsset, preferring the container index."""
+        # Container entries only cover named assets, so this avoids touching
+        # every texture in the bundle
+        for container_path, pptr in env.container.items():
+            asset_name = container_path.rsplit("/", 1)[-1].split(".", 1)[0]
+            if asset_name.lower() == self.WEAPON_LIST_ASSET:
+                # UnityPy's stubs leave container entries untyped; both the
+                # ObjectReader of older releases and PPtr provide read()
+                data = pptr.read()  # type: ignore[attr-defined]
+                if getattr(data, "m_Name", None) == self.WEAPON_LIST_ASSET:
+                    return data
+
+        # Fall back to a full scan for bundles without a usable container,
+        # peeking at names so only the matching asset is fully deserialized
+        for obj in env.objects:
+            if obj.type.name != "TextAsset":
+                continue
+
+            if _peek_name(obj) not in (None, self.WEAPON_LIST_ASSET):
+                continue
+
+            data = obj.read()
+            if data.m_Name == self.WEAPON_LIST_ASSET:
+                return data
+
+        return None
+
     def _extract_text_content(self, text_asset: TextAsset) -> str:
         """Extract text content from TextAsset with proper encoding handling."""
-        if isinstance(text_asset.m_Script, bytes):
-            # Try different encodings
-            for encoding in ['utf-8', 'utf-16', 'latin-1']:
+        script = text_asset.m_Script
+        if not isinstance(script, bytes):
+            return str(script).replace("\r", "")
+
+        # An explicit byte order mark settles the encoding without guessing
+        for bom, encoding in _TEXT_BOMS:
+            if script.startswith(bom):
                 try:
-                    return text_asset.m_Script.decode(encoding, errors='ignore').replace("\r", "")
+                    return script.decode(encoding).replace("\r", "")
                 except UnicodeDecodeError:
-                    continue
-            # Fallback: treat as binary and extract printable characters
-            return ''.join(chr(b) for b in text_asset.m_Script if 32 <= b <= 126)
-        else:
-            return str(text_asset.m_Script).replace("\r", "")
+                    break
+
+        try:
+            # CR bytes never occur inside multi-byte UTF-8 sequences, so they
+            # can be dropped before decoding
+            return script.translate(None, b"\r").decode("utf-8")
+        except UnicodeDecodeError:
+            pass
+
+        detected = _detect_encoding(script)
+        if detected:
+            return script.decode(detected, errors="replace").replace("\r", "")
+
+        # Fallback: treat as binary and extract printable characters
+        return script.translate(None, _NON_PRINTABLE).decode("ascii")
 
     def _parse_weapon_names(self, text_content: str) -> list[str]:
         """Parse weapon names from text content with validation."""
-        lines = [line.strip() for line in text_content.split("\n")]
+        weapon_names = []
+        for line in text_content.split("\n"):
+            line = line.strip()
 
-        # Remove empty lines and comments
-        lines = [line for line in lines if line and not line.startswith("#")]
+            # Skip empty lines and comments
+            if not line or line.startswith("#"):
+                continue
 
-        weapon_names = []
-        for line in lines:
-            # Extract weapon names (remove file extensions and clean up)
-            if ".png" in line:
-                weapon_name = line.split(".png")[0].strip()
-                if weapon_name and weapon_name.isalnum() or '_' in weapon_name:
+            suffix = _PNG_SUFFIX.search(line)
+            if suffix:
+                # Extract weapon names (remove file extensions and clean up)
+                weapon_name = line[:suffix.start()].strip()
+                if (weapon_name and weapon_name.isalnum()) or '_' in weapon_name:
                     weapon_names.append(weapon_name)
-            elif line and not any(char in line for char in ['/', '\\', '?', '*', '<', '>', '|']):
+            elif _PATH_CHARS.isdisjoint(line):
                 # Direct weapon name without extension
                 weapon_names.append(line)
 
@@ -101,22 +224,24 @@ class WeaponListProcessor:
 
     def _filter_weapons(self, weapon_list: list[str]) -> list[str]:
         """Filter weapons using blacklist and validation rules."""
-        blacklist = self.config.get_combined_blacklist()
+        # Build the case-insensitive lookup set once instead of per weapon
+        blacklist = frozenset(item.lower() for item in self.config.get_combined_blacklist())
+        debug = self.logger.debug
 
         filtered_list = []
         for weapon in weapon_list:
             # Skip blacklisted items
-            if self.config.is_blacklisted(weapon):
-                self.logger.debug(f"Filtered blacklisted weapon: {weapon}")
+            if weapon.lower() in blacklist:
+                debug(f"Filtered blacklisted weapon: {weapon}")
                 continue
 
             # Additional validation
             if len(weapon) < 2:  # Too short
-                self.logger.debug(f"Filtered too short weapon name: {weapon}")
+                debug(f"Filtered too short weapon name: {weapon}")
                 continue
 
             if len(weapon) > 50:  # Too long
-                self.logger.debug(f"Filtered too long weapon name: {weapon}")
+                debug(f"Filtered too long weapon name: {weapon}")
                 continue
 
             filtered_list.append(weapon)
@@ -153,19 +278,25 @@ class WeaponListProcessor:
             raise UnpackError(f"Failed to save weapon list: {e}") from e
 
     def _save_legacy_format(self, weapon_list: list[str]) -> None:
-        """Save weapon list in legacy txt format for backward compatibility."""
+        """Save weapon list in legacy txt format for backward compatibility.
+
+        The list is sorted in place; callers pass a list they own.
+        """
         try:
             # Create parent directory if needed
             self.config.weapons_file.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(self.config.weapons_file, "w", encoding="utf-8") as f:
-                f.write(f"# WOG Dump Weapon List (Legacy Format)\n")
-                f.write(f"# This file is deprecated, use data.json instead\n")
-                f.write(f"# Total weapons: {len(weapon_list)}\n")
-                f.write(f"# Blacklisted items filtered\n\n")
+            header = (
+                "# WOG Dump Weapon List (Legacy Format)\n"
+                "# This file is deprecated, use data.json instead\n"
+                f"# Total weapons: {len(weapon_list)}\n"
+                "# Blacklisted items filtered\n\n"
+            )
 
-                for weapon in sorted(weapon_list):
-                    f.write(f"{weapon}\n")
+            # Build the whole payload up front and write it in one call
+            weapon_list.sort()
+            payload = header + "\n".join(weapon_list) + "\n"
+            self.config.weapons_file.write_text(payload, encoding="utf-8")
 
             self.logger.debug(f"Saved legacy format to {self.config.weapons_file}")
 
@@ -210,19 +341,20 @@ class WeaponListProcessor:
 
         try:
             weapons = []
-            with open(self.config.weapons_file, "r", encoding="utf-8") as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    if not line or line.startswith('#'):
-                        continue
+            # Read the file in one go and let str.splitlines do the splitting
+            content = self.config.weapons_file.read_text(encoding="utf-8")
+            for line_num, line in enumerate(content.splitlines(), 1):
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
 
-                    if validate:
-                        # Validate weapon name format
-                        if not line.replace('_', '').replace('-', '').isalnum():
-                            self.logger.warning(f"Invalid weapon name at line {line_num}: {line}")
-                            continue
+                if validate:
+                    # Validate weapon name format
+                    if not _VALID_WEAPON_NAME.fullmatch(line):
+                        self.logger.warning(f"Invalid weapon name at line {line_num}: {line}")
+                        continue
 
-                    weapons.append(line)
+                weapons.append(line)
 
             self.logger.info(f"Loaded {len(weapons)} weapons from legacy file {self.config.weapons_file}")
             return weapons
@@ -260,6 +392,12 @@ class AssetUnpacker:
             'objects_skipped': 0,
             'objects_failed': 0,
         }
+        self._stats_lock = threading.Lock()
+        # Bound extractor per supported type, resolved once instead of per object
+        self._dispatch = {
+            type_name: getattr(self, method_name)
+            for type_name, method_name in self.SUPPORTED_TYPES.items()
+        }
 
     def unpack_asset(self, asset_path: Path, output_dir: Path | None = None,
                     extract_types: list[str] | None = None) -> list[Path]:
@@ -270,47 +408,58 @@ class AssetUnpacker:
         if output_dir is None:
             output_dir = asset_path.parent / "unpacked" / asset_path.stem
 
+        # Narrow the dispatch table to the requested types up front
         if extract_types is None:
-            extract_types = list(self.SUPPORTED_TYPES.keys())
+            dispatch = self._dispatch
+        else:
+            dispatch = {name: self._dispatch[name] for name in extract_types if name in self._dispatch}
 
         output_dir.mkdir(parents=True, exist_ok=True)
-        extracted_files = []
+        extracted_files: list[Path] = []
+        add_file = extracted_files.append
+        warning = self.logger.warning
+
+        # Count locally and merge into the shared stats once, under the lock,
+        # since several unpack threads may be running at the same time
+        processed = skipped = failed = 0
 
         try:
             with self.logger.time_operation(f"unpack_{asset_path.stem}"):
                 env = UnityPy.load(str(asset_path))
 
                 for obj in env.objects:
-                    self._extraction_stats['objects_processed'] += 1
-
-                    if obj.type.name not in extract_types:
-                        self._extraction_stats['objects_skipped'] += 1
-                        continue
+                    processed += 1
 
-                    if obj.type.name not in self.SUPPORTED_TYPES:
-                        self._extraction_stats['objects_skipped'] += 1
+                    type_name = obj.type.name
+                    extract_method = dispatch.get(type_name)
+                    if extract_method is None:
+                        skipped += 1
                         continue
 
                     try:
-                        # Get the extraction method
-                        extract_method = getattr(self, self.SUPPORTED_TYPES[obj.type.name])
                         extracted_file = extract_method(obj, output_dir)
 
                         if extracted_file:
-                            extracted_files.append(extracted_file)
-                            self._extraction_stats['objects_extracted'] += 1
+                            add_file(extracted_file)
                         else:
-                            self._extraction_stats['objects_skipped'] += 1
+                            skipped += 1
 
                     except Exception as e:
-                        self.logger.warning(f"Failed to extract object {obj.type.name}: {e}")
-                        self._extraction_stats['objects_failed'] += 1
+                        warning(f"Failed to extract object {type_name}: {e}")
+                        failed += 1
 
                 self.logger.info(f"Unpacked {asset_path.name}: {len(extracted_files)} files extracted")
                 return extracted_files
 
         except Exception as e:
             raise AssetProcessingError(f"Failed to unpack asset {asset_path}: {e}") from e
+        finally:
+            with self._stats_lock:
+                stats = self._extraction_stats
+                stats['objects_processed'] += processed
+                stats['objects_extracted'] += len(extracted_files)
+                stats['objects_skipped'] += skipped
+                stats['objects_failed'] += failed
 
     def _extract_text_asset(self, obj, output_dir: Path) -> Path | None:
         """Extract TextAsset objects."""
@@ -323,35 +472,37 @@ class AssetUnpacker:
             if hasattr(data, 'm_Script') and data.m_Script:
                 content = data.m_Script
 
-                # Detect content type
+                # Detect content type from a prefix instead of decoding the whole payload
                 if isinstance(content, bytes):
-                    # Try to determine if it's text or binary
                     try:
-                        text_content = content.decode('utf-8')
+                        # An incremental decoder tolerates a character cut off at the boundary
+                        prefix = _UTF8_DECODER().decode(content[:_TEXT_SNIFF_SIZE])
+                        payload = content
                         is_text = True
                     except UnicodeDecodeError:
                         is_text = False
                 else:
                     text_content = str(content)
+                    prefix = text_content[:_TEXT_SNIFF_SIZE]
+                    payload = text_content.encode('utf-8')
                     is_text = True
 
                 # Choose extension and write method
                 if is_text:
-                    if text_content.strip().startswith('{') or text_content.strip().startswith('['):
+                    leading = prefix.lstrip()[:1]
+                    if leading in ('{', '['):
                         extension = '.json'
-                    elif text_content.strip().startswith('<'):
+                    elif leading == '<':
                         extension = '.xml'
                     else:
                         extension = '.txt'
 
                     output_path = output_dir / f"{data.m_Name}{extension}"
-                    with open(output_path, 'w', encoding='utf-8') as f:
-                        f.write(text_content)
+                    output_path.write_bytes(payload)
                 else:
                     extension = '.bytes'
                     output_path = output_dir / f"{data.m_Name}{extension}"
-                    with open(output_path, 'wb') as f:
-                        f.write(content)
+                    output_path.write_bytes(bytes(content))
 
                 return output_path
 
@@ -371,7 +522,11 @@ class AssetUnpacker:
             image = data.image
             if image:
                 output_path = output_dir / f"{data.m_Name}.png"
-                image.save(output_path)
+                # The zlib level defaults to Pillow's own; lowering it trades
+                # file size for encoding time
+                buffer = io.BytesIO()
+                image.save(buffer, format="PNG", compress_level=self.config.png_compress_level)
+                output_path.write_bytes(buffer.getvalue())
                 return output_path
 
         except Exception as e:
@@ -389,31 +544,31 @@ class AssetUnpacker:
             # Basic mesh data extraction
             output_path = output_dir / f"{data.m_Name}.obj"
 
-            with open(output_path, 'w') as f:
-                f.write(f"# Mesh: {data.m_Name}\n")
-                f.write(f"# Exported from WOG Dump\n\n")
+            # Collect all lines and write the file in one call
+            lines = [f"# Mesh: {data.m_Name}\n", "# Exported from WOG Dump\n\n"]
 
-                # Write vertex data if available
-                if hasattr(data, 'm_Vertices') and data.m_Vertices:
-                    for vertex in data.m_Vertices:
-                        f.write(f"v {vertex.x} {vertex.y} {vertex.z}\n")
+            # Vertex data if available
+            if hasattr(data, 'm_Vertices') and data.m_Vertices:
+                lines.extend(f"v {v.x} {v.y} {v.z}\n" for v in data.m_Vertices)
 
-                # Write UV coordinates if available
-                if hasattr(data, 'm_UV') and data.m_UV:
-                    for uv in data.m_UV:
-                        f.write(f"vt {uv.x} {uv.y}\n")
+            # UV coordinates if available
+            if hasattr(data, 'm_UV') and data.m_UV:
+                lines.extend(f"vt {uv.x} {uv.y}\n" for uv in data.m_UV)
 
-                # Write normals if available
-                if hasattr(data, 'm_Normals') and data.m_Normals:
-                    for normal in data.m_Normals:
-                        f.write(f"vn {normal.x} {normal.y} {normal.z}\n")
+            # Normals if available
+            if hasattr(data, 'm_Normals') and data.m_Normals:
+                lines.extend(f"vn {n.x} {n.y} {n.z}\n" for n in data.m_Normals)
 
-                # Write faces if available
-                if hasattr(data, 'm_Triangles') and data.m_Triangles:
-                    triangles = data.m_Triangles
-                    for i in range(0, len(triangles), 3):
-                        if i + 2 < len(triangles):
-                            f.write(f"f {triangles[i]+1} {triangles[i+1]+1} {triangles[i+2]+1}\n")
+            # Faces if available (an incomplete trailing triangle is dropped)
+            if hasattr(data, 'm_Triangles') and data.m_Triangles:
+                # Shift to 1-based indices and format every face in a single
+                # %-operation instead of one format call per face
+                triangles = data.m_Triangles
+                face_count = len(triangles) // 3
+                indices = tuple(i + 1 for i in triangles[:face_count * 3])
+                lines.append(("f %d %d %d\n" * face_count) % indices)
+
+            output_path.write_bytes("".join(lines).encode("utf-8"))
 
             return output_path
 
@@ -466,8 +621,7 @@ class AssetUnpacker:
                             'texture_name': tex_prop['second']['m_Texture'].get('m_Name', 'None')
                         }
 
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(material_data, f, indent=2)
+            output_path.write_bytes(_dump_json(material_data))
 
             return output_path
 
@@ -492,8 +646,7 @@ class AssetUnpacker:
                 'legacy': getattr(data, 'm_Legacy', False),
             }
 
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(anim_data, f, indent=2)
+            output_path.write_bytes(_dump_json(anim_data))
 
             return output_path
 
@@ -519,8 +672,7 @@ class AssetUnpacker:
                 'channels': getattr(data, 'm_Channels', 0),
             }
 
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(audio_data, f, indent=2)
+            output_path.write_bytes(_dump_json(audio_data))
 
             return output_path
 
@@ -535,29 +687,20 @@ class AssetUnpacker:
         if output_dir is None:
             output_dir = self.config.base_dir / "runtime" / "unpacked"
 
-        results = {}
+        results: dict[Path, list[Path]] = {}
 
         with self.logger.create_task_progress() as progress:
             task = progress.add_task("Unpacking assets", total=len(asset_paths))
 
-            # Use parallel processing for large numbers of assets
+            # Use parallel processing for large numbers of assets; decoding is
+            # CPU-bound, so separate processes are preferred when allowed
             if len(asset_paths) > 5:
-                with ThreadPoolExecutor(max_workers=self.config.max_threads) as executor:
-                    future_to_asset = {
-                        executor.submit(self._unpack_single_asset_safe, asset_path, output_dir, extract_types): asset_path
-                        for asset_path in asset_paths
-                    }
-
-                    for future in as_completed(future_to_asset):
-                        asset_path = future_to_asset[future]
-                        try:
-                            extracted_files = future.result()
-                            results[asset_path] = extracted_files
-                        except Exception as e:
-                            self.logger.error(f"Failed to unpack {asset_path}: {e}")
-                            results[asset_path] = []
-
-                        progress.update(task, advance=1)
+                in_processes = self.config.max_threads > 1 and self._unpack_in_processes(
+                    asset_paths, output_dir, extract_types, results, progress, task
+                )
+                if not in_processes:
+                    self._unpack_in_threads(asset_paths, output_dir, extract_types,
+                                            results, progress, task)
             else:
                 # Sequential processing for small numbers
                 for asset_path in asset_paths:
@@ -585,6 +728,66 @@ class AssetUnpacker:
 
         return results
 
+    def _unpack_in_threads(self, asset_paths: list[Path], output_dir: Path,
+                           extract_types: list[str] | None, results: dict[Path, list[Path]],
+                           progress: Progress, task: TaskID) -> None:
+        """Unpack assets on the thread pool, recording results as they finish."""
+        with ThreadPoolExecutor(max_workers=self.config.max_threads) as executor:
+            future_to_asset = {
+                executor.submit(self._unpack_single_asset_safe, asset_path, output_dir, extract_types): asset_path
+                for asset_path in asset_paths
+            }
+
+            for future in as_completed(future_to_asset):
+                asset_path = future_to_asset[future]
+                try:
+                    extracted_files = future.result()
+                    results[asset_path] = extracted_files
+                except Exception as e:
+                    self.logger.error(f"Failed to unpack {asset_path}: {e}")
+                    results[asset_path] = []
+
+                progress.update(task, advance=1)
+
+    def _unpack_in_processes(self, asset_paths: list[Path], output_dir: Path,
+                             extract_types: list[str] | None, results: dict[Path, list[Path]],
+                             progress: Progress, task: TaskID) -> bool:
+        """Unpack assets on a process pool; returns False if no pool could be started."""
+        context = multiprocessing.get_context("spawn")
+        try:
+            # Workers log through this process instead of opening their own log files
+            log_forwarder = WorkerLogForwarder(context)
+            executor = ProcessPoolExecutor(max_workers=self.config.max_threads, mp_context=context,
+                                           initializer=init_worker_logging,
+                                           initargs=log_forwarder.initargs)
+        except (OSError, NotImplementedError) as e:
+            self.logger.debug(f"Process pool unavailable, using threads: {e}")
+            return False
+
+        config_data = self.config.model_dump()
+
+        with log_forwarder, executor:
+            future_to_asset = {
+                executor.submit(_unpack_in_worker, config_data, asset_path, output_dir, extract_types): asset_path
+                for asset_path in asset_paths
+            }
+
+            for future in as_completed(future_to_asset):
+                asset_path = future_to_asset[future]
+                try:
+                    extracted_files, worker_stats = future.result()
+                    results[asset_path] = extracted_files
+                    with self._stats_lock:
+                        for key, value in worker_stats.items():
+                            self._extraction_stats[key] += value
+                except Exception as e:
+                    self.logger.error(f"Failed to unpack {asset_path}: {e}")
+                    results[asset_path] = []
+
+                progress.update(task, advance=1)
+
+        return True
+
     def _unpack_single_asset_safe(self, asset_path: Path, output_dir: Path,
                                  extract_types: list[str] | None) -> list[Path]:
         """Safe wrapper for unpacking a single asset."""
@@ -624,18 +827,25 @@ class AssetUnpacker:
                     "path_id": obj.path_id,
                 }
 
-                # Try to get object name
+                # Try to get object name; the raw type tree is enough here and
+                # avoids decoding texture pixels or building mesh objects
                 try:
-                    data = obj.read()
-                    if hasattr(data, 'm_Name') and data.m_Name:
-                        obj_info["name"] = data.m_Name
+                    tree = obj.read_typetree()
+                    if tree.get('m_Name'):
+                        obj_info["name"] = tree['m_Name']
 
                     # Additional type-specific info
-                    if obj_type == "Texture2D" and hasattr(data, 'image'):
-                        obj_info["dimensions"] = f"{data.m_Width}x{data.m_Height}"
-                        obj_info["format"] = str(data.m_TextureFormat)
-                    elif obj_type == "Mesh" and hasattr(data, 'm_VertexCount'):
-                        obj_info["vertex_count"] = data.m_VertexCount
+                    if obj_type == "Texture2D" and 'm_Width' in tree:
+                        obj_info["dimensions"] = f"{tree['m_Width']}x{tree.get('m_Height', 0)}"
+                        texture_format = tree.get('m_TextureFormat')
+                        if texture_format is not None:
+                            try:
+                                # Report the enum name, as reading the full object did
+                                obj_info["format"] = TextureFormat(texture_format).name
+                            except ValueError:
+                                obj_info["format"] = str(texture_format)
+                    elif obj_type == "Mesh" and 'm_VertexCount' in tree:
+                        obj_info["vertex_count"] = tree['m_VertexCount']
 
                 except Exception:
                     pass  # Skip objects that can't be read
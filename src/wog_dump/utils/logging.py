@@ -2,35 +2,102 @@
 
 from __future__ import annotations
 
+import atexit
+import io
 import logging
+import logging.handlers
+import os
+import queue
 import sys
+import threading
 import time
 from contextlib import contextmanager
 from datetime import datetime
+from multiprocessing.context import BaseContext
 from pathlib import Path
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, TextIO, cast
 
 from rich.console import Console
-from rich.logging import RichHandler
-from rich.progress import (
-    BarColumn,
-    DownloadColumn,
-    MofNCompleteColumn,
-    Progress,
-    SpinnerColumn,
-    TextColumn,
-    TimeElapsedColumn,
-    TransferSpeedColumn,
-)
-from rich.table import Table
-from rich.panel import Panel
-from rich.text import Text
+
+# The remaining Rich modules are imported where they are used, so commands
+# that never draw a table or progress bar do not pay for loading them
+if TYPE_CHECKING:
+    from multiprocessing.queues import Queue as ProcessQueue
+
+    from rich.progress import Progress
+    from rich.text import Text
+
+# Emoji and color used by print_status for each status level
+_STATUS_STYLES = {
+    "info": ("ℹ️", "blue"),
+    "success": ("✅", "green"),
+    "warning": ("⚠️", "yellow"),
+    "error": ("❌", "red"),
+    "processing": ("🔄", "cyan"),
+}
+
+# Name given to the console handler so set_level can find it regardless of type
+_CONSOLE_HANDLER_NAME = "wog_console"
+
+
+class _StdoutHandler(logging.StreamHandler):
+    """Plain stream handler that follows sys.stdout, like the Rich console does."""
+
+    @property
+    def stream(self) -> TextIO:
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value: TextIO) -> None:
+        pass
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """File handler that lets a write buffer absorb most per-record flushes.
+
+    StreamHandler flushes after every record, which costs one write syscall
+    per log line. Records are buffered instead and reach disk with the first
+    record logged flush_interval seconds after the previous flush, on ERROR
+    and above, and when the handler is closed.
+    """
+
+    buffer_size = 64 * 1024
+    flush_interval = 1.0
+    _last_flush = 0.0
+
+    def _open(self) -> io.TextIOWrapper:
+        stream = open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                      encoding=self.encoding, errors=self.errors)
+        return cast(io.TextIOWrapper, stream)
+
+    def flush(self) -> None:
+        # Called by StreamHandler.emit for every record; only pass it on to
+        # the file once flush_interval has elapsed
+        now = time.monotonic()
+        if now - self._last_flush >= self.flush_interval:
+            self._last_flush = now
+            super().flush()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        super().emit(record)
+        if record.levelno >= logging.ERROR:
+            super().flush()
+
+    def close(self) -> None:
+        # FileHandler.close would go through the rate-limited flush above
+        super().flush()
+        super().close()
 
 
 class PerformanceMonitor:
     """Monitor and track performance metrics."""
 
+    __slots__ = ("metrics", "start_times")
+
     def __init__(self) -> None:
-        self.metrics: dict[str, list[float]] = {}
+        # Running count/total/min/max per operation instead of every sample
+        self.metrics: dict[str, dict[str, float]] = {}
         self.start_times: dict[str, float] = {}
 
     def start_timer(self, operation: str) -> None:
@@ -39,30 +106,38 @@ class PerformanceMonitor:
 
     def stop_timer(self, operation: str) -> float:
         """Stop timing an operation and record the duration."""
-        if operation not in self.start_times:
+        # pop() checks for and removes the start time in one lookup
+        start_time = self.start_times.pop(operation, None)
+        if start_time is None:
             return 0.0
 
-        duration = time.perf_counter() - self.start_times[operation]
+        duration = time.perf_counter() - start_time
 
-        if operation not in self.metrics:
-            self.metrics[operation] = []
+        metric = self.metrics.get(operation)
+        if metric is None:
+            self.metrics[operation] = {"count": 1, "total": duration, "min": duration, "max": duration}
+        else:
+            metric["count"] += 1
+            metric["total"] += duration
+            if duration < metric["min"]:
+                metric["min"] = duration
+            if duration > metric["max"]:
+                metric["max"] = duration
 
-        self.metrics[operation].append(duration)
-        del self.start_times[operation]
         return duration
 
     def get_stats(self, operation: str) -> dict[str, float]:
         """Get statistics for an operation."""
-        if operation not in self.metrics:
+        metric = self.metrics.get(operation)
+        if metric is None:
             return {}
 
-        times = self.metrics[operation]
         return {
-            "count": len(times),
-            "total": sum(times),
-            "average": sum(times) / len(times),
-            "min": min(times),
-            "max": max(times),
+            "count": metric["count"],
+            "total": metric["total"],
+            "average": metric["total"] / metric["count"],
+            "min": metric["min"],
+            "max": metric["max"],
         }
 
     @contextmanager
@@ -83,6 +158,14 @@ class WOGLogger:
         self.logger = logging.getLogger(name)
         self.logger.setLevel(level)
         self.performance_monitor = PerformanceMonitor()
+        self._listener: logging.handlers.QueueListener | None = None
+        self._file_handler: _BufferedFileHandler | None = None
+        # Handlers this instance attached, removed again by close()
+        self._handlers: list[logging.Handler] = []
+        self._status_heads: dict[tuple[str, str], Text] = {}
+        # Piped output gets plain lines from the print_* helpers instead of
+        # Rich renderables whose styling would be stripped anyway
+        self._is_tty = self.console.is_terminal
 
         # Prevent duplicate handlers
         if not self.logger.handlers:
@@ -93,16 +176,9 @@ class WOGLogger:
         # Clear any existing handlers
         self.logger.handlers.clear()
 
-        # Rich console handler with custom formatting
-        rich_handler = RichHandler(
-            console=self.console,
-            show_path=False,
-            show_time=True,
-            markup=True,
-            rich_tracebacks=True,
-            tracebacks_show_locals=True,
-        )
-        rich_handler.setLevel(logging.INFO)
+        console_handler = self._create_console_handler()
+        console_handler.set_name(_CONSOLE_HANDLER_NAME)
+        console_handler.setLevel(logging.INFO)
 
         # Create logs directory and file handler
         log_dir = Path("logs")
@@ -111,7 +187,7 @@ class WOGLogger:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         log_file = log_dir / f"wog_dump_{timestamp}.log"
 
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
+        file_handler = _BufferedFileHandler(log_file, encoding='utf-8')
         file_handler.setLevel(logging.DEBUG)
 
         # Enhanced formatter with more context
@@ -122,34 +198,96 @@ class WOGLogger:
         file_handler.setFormatter(file_formatter)
 
         # Add handlers
-        self.logger.addHandler(rich_handler)
-        self.logger.addHandler(file_handler)
+        # File output is written by a background listener thread, so logging
+        # threads only enqueue records instead of contending on disk I/O
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setLevel(logging.DEBUG)
+        self._file_handler = file_handler
+        self._listener = logging.handlers.QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        self._listener.start()
+        atexit.register(self.close)
+
+        self._handlers = [console_handler, queue_handler]
+        for handler in self._handlers:
+            self.logger.addHandler(handler)
 
         # Log initialization
         self.debug(f"Logger initialized - Log file: {log_file}")
 
-    def info(self, message: str, **kwargs) -> None:
+    def _create_console_handler(self) -> logging.Handler:
+        """Create the console handler: Rich on a terminal, plain text otherwise.
+
+        Piped and CI output (or WOG_PLAIN_LOGS=1) gets a stdlib StreamHandler,
+        which skips Rich's markup and layout work on every record.
+        """
+        if not self.console.is_terminal or os.environ.get("WOG_PLAIN_LOGS"):
+            handler = _StdoutHandler()
+            handler.setFormatter(logging.Formatter(
+                fmt="%(asctime)s %(levelname)s %(message)s",
+                datefmt="%H:%M:%S"
+            ))
+            return handler
+
+        from rich.logging import RichHandler
+        return RichHandler(
+            console=self.console,
+            show_path=False,
+            show_time=True,
+            markup=True,
+            rich_tracebacks=True,
+            tracebacks_show_locals=True,
+        )
+
+    def close(self) -> None:
+        """Write any queued records, then stop the listener and close the log file."""
+        atexit.unregister(self.close)
+        # Detach first so nothing is queued for a listener that has stopped;
+        # a later WOGLogger then sets up fresh handlers
+        for handler in self._handlers:
+            self.logger.removeHandler(handler)
+        self._handlers = []
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+        if self._file_handler is not None:
+            self._file_handler.close()
+            self._file_handler = None
+
+    # The level methods pass %-style args through so that formatting is
+    # skipped entirely for records below the logger's level
+
+    def info(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log info message."""
-        self.logger.info(message, **kwargs)
+        self.logger.info(message, *args, **kwargs)
 
-    def debug(self, message: str, **kwargs) -> None:
+    def debug(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log debug message."""
-        self.logger.debug(message, **kwargs)
+        self.logger.debug(message, *args, **kwargs)
 
-    def warning(self, message: str, **kwargs) -> None:
+    def warning(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log warning message."""
-        self.logger.warning(message, **kwargs)
+        self.logger.warning(message, *args, **kwargs)
 
-    def error(self, message: str, **kwargs) -> None:
+    def error(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log error message."""
-        self.logger.error(message, **kwargs)
+        self.logger.error(message, *args, **kwargs)
 
-    def critical(self, message: str, **kwargs) -> None:
+    def critical(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Log critical message."""
-        self.logger.critical(message, **kwargs)
+        self.logger.critical(message, *args, **kwargs)
 
     def print_banner(self) -> None:
         """Print enhanced application banner."""
+        if not self._is_tty:
+            sys.stdout.write("🔫 WOG Dump v2.3 | World of Guns Model Extractor\n")
+            return
+
+        from rich.panel import Panel
+        from rich.text import Text
+
         banner_text = Text.assemble(
             ("🔫 WOG Dump v2.3", "bold cyan"),
             (" | ", "white"),
@@ -166,28 +304,42 @@ class WOGLogger:
 
     def print_status(self, message: str, status: str = "info", prefix: str = "WOG DUMP") -> None:
         """Print status message with enhanced styling."""
-        status_styles = {
-            "info": ("ℹ️", "blue"),
-            "success": ("✅", "green"),
-            "warning": ("⚠️", "yellow"),
-            "error": ("❌", "red"),
-            "processing": ("🔄", "cyan"),
-        }
+        emoji, color = _STATUS_STYLES.get(status, _STATUS_STYLES["info"])
 
-        emoji, color = status_styles.get(status, ("ℹ️", "blue"))
+        if not self._is_tty:
+            sys.stdout.write(f"[{prefix}] {emoji} {message}\n")
+            return
 
-        text = Text.assemble(
-            (f"[{prefix}]", f"bold {color}"),
-            (" ", "white"),
-            (emoji, "white"),
-            (" ", "white"),
-            (message, color),
-        )
+        # The styled "[prefix] emoji " head only depends on prefix and status
+        head = self._status_heads.get((prefix, status))
+        if head is None:
+            from rich.text import Text
+
+            head = Text.assemble(
+                (f"[{prefix}]", f"bold {color}"),
+                (" ", "white"),
+                (emoji, "white"),
+                (" ", "white"),
+            )
+            self._status_heads[(prefix, status)] = head
+
+        text = head.copy()
+        text.append(message, style=color)
 
         self.console.print(text)
 
     def create_download_progress(self) -> Progress:
         """Create enhanced progress bar for downloads."""
+        from rich.progress import (
+            BarColumn,
+            DownloadColumn,
+            Progress,
+            SpinnerColumn,
+            TextColumn,
+            TimeElapsedColumn,
+            TransferSpeedColumn,
+        )
+
         return Progress(
             SpinnerColumn(),
             TextColumn("[bold blue]{task.description}", justify="right"),
@@ -205,6 +357,15 @@ class WOGLogger:
 
     def create_task_progress(self) -> Progress:
         """Create enhanced progress bar for general tasks."""
+        from rich.progress import (
+            BarColumn,
+            MofNCompleteColumn,
+            Progress,
+            SpinnerColumn,
+            TextColumn,
+            TimeElapsedColumn,
+        )
+
         return Progress(
             SpinnerColumn(),
             TextColumn("[bold blue]{task.description}", justify="right"),
@@ -221,6 +382,8 @@ class WOGLogger:
     def print_table(self, title: str, headers: list[str], rows: list[list[str]],
                    style: str = "cyan") -> None:
         """Print a formatted table with enhanced styling."""
+        from rich.table import Table
+
         table = Table(
             title=title,
             show_header=True,
@@ -253,6 +416,12 @@ class WOGLogger:
         if len(errors) > max_display:
             panel_content.append(f"... and {len(errors) - max_display} more errors")
 
+        if not self._is_tty:
+            sys.stdout.write("Errors Encountered:\n" + "\n".join(panel_content) + "\n")
+            return
+
+        from rich.panel import Panel
+
         error_panel = Panel(
             "\n".join(panel_content),
             title="[bold red]Errors Encountered",
@@ -271,6 +440,8 @@ class WOGLogger:
             self.console.print("[yellow]No performance metrics available[/yellow]")
             return
 
+        from rich.table import Table
+
         table = Table(
             title="Performance Summary",
             show_header=True,
@@ -311,16 +482,22 @@ class WOGLogger:
 
         self.print_status(f"Starting {description}...", "processing")
 
-        with self.time_operation(operation):
-            start_time = time.perf_counter()
-            try:
-                yield
-                duration = time.perf_counter() - start_time
-                self.print_status(f"Completed {description} in {duration:.2f}s", "success")
-            except Exception as e:
-                duration = time.perf_counter() - start_time
-                self.print_status(f"Failed {description} after {duration:.2f}s: {str(e)}", "error")
-                raise
+        # The monitor's own measurement doubles as the duration reported here
+        monitor = self.performance_monitor
+        monitor.start_timer(operation)
+        try:
+            yield
+        except Exception as e:
+            duration = monitor.stop_timer(operation)
+            self.print_status(f"Failed {description} after {duration:.2f}s: {str(e)}", "error")
+            raise
+        finally:
+            # Also stops the timer on KeyboardInterrupt, SystemExit and
+            # GeneratorExit; after a failure it has already been stopped and
+            # this returns 0.0
+            duration = monitor.stop_timer(operation)
+
+        self.print_status(f"Completed {description} in {duration:.2f}s", "success")
 
     def log_system_info(self) -> None:
         """Log system information for debugging."""
@@ -343,7 +520,7 @@ class WOGLogger:
 
         # Update handler levels
         for handler in self.logger.handlers:
-            if isinstance(handler, RichHandler):
+            if handler.get_name() == _CONSOLE_HANDLER_NAME:
                 # Console handler should show INFO and above
                 handler.setLevel(max(level, logging.INFO))
 
@@ -353,18 +530,28 @@ class LoggerManager:
     """Singleton logger manager."""
 
     _instance: WOGLogger | None = None
+    _lock = threading.Lock()
 
     @classmethod
     def get_logger(cls, name: str = "wog_dump") -> WOGLogger:
         """Get the global logger instance."""
-        if cls._instance is None:
-            cls._instance = WOGLogger(name)
-        return cls._instance
+        # Double-checked so concurrent first calls cannot build two loggers
+        # with their own file handlers
+        instance = cls._instance
+        if instance is None:
+            with cls._lock:
+                instance = cls._instance
+                if instance is None:
+                    instance = cls._instance = WOGLogger(name)
+        return instance
 
     @classmethod
     def reset_logger(cls) -> None:
-        """Reset the logger instance."""
-        cls._instance = None
+        """Reset the logger instance, closing the current one."""
+        with cls._lock:
+            if cls._instance is not None:
+                cls._instance.close()
+            cls._instance = None
 
 
 # Convenience functions for backward compatibility
@@ -377,3 +564,56 @@ def set_log_level(level: int | str) -> None:
     """Set the log level for the global logger."""
     logger = get_logger()
     logger.set_level(level)
+
+
+class _ForwardHandler(logging.Handler):
+    """Hand records received from worker processes to a local logger."""
+
+    def __init__(self, target: logging.Logger) -> None:
+        super().__init__()
+        self.target = target
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.target.handle(record)
+
+
+class WorkerLogForwarder:
+    """Route log records from pool worker processes to this process's logger.
+
+    Workers spawned with ``initargs`` and an initializer that calls
+    init_worker_logging send their records through a queue instead of
+    opening their own log file and console; the records are written by the
+    parent's handlers, at the parent's level.
+    """
+
+    def __init__(self, context: BaseContext) -> None:
+        logger = get_logger().logger
+        self.queue: ProcessQueue[logging.LogRecord] = context.Queue()
+        self.level = logger.getEffectiveLevel()
+        self._listener = logging.handlers.QueueListener(self.queue, _ForwardHandler(logger))
+
+    @property
+    def initargs(self) -> tuple[ProcessQueue[logging.LogRecord], int]:
+        """Arguments for init_worker_logging in each worker."""
+        return self.queue, self.level
+
+    def __enter__(self) -> WorkerLogForwarder:
+        self._listener.start()
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None,
+                 exc_val: BaseException | None, exc_tb: TracebackType | None) -> None:
+        # Stop only after the pool has shut down so no worker record is lost
+        self._listener.stop()
+        self.queue.close()
+        self.queue.join_thread()
+
+
+def init_worker_logging(log_queue: ProcessQueue[logging.LogRecord], level: int) -> None:
+    """Set up the global logger in a pool worker to forward to the parent."""
+    logger = logging.getLogger("wog_dump")
+    logger.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+    logger.setLevel(level)
+
+    with LoggerManager._lock:
+        LoggerManager._instance = WOGLogger(logger.name, level)
@@ -2,13 +2,83 @@
 
 from __future__ import annotations
 
+import fnmatch
+import io
+import multiprocessing
+import os
+import re
+import shutil
 import sys
+import tempfile
+from collections.abc import Callable, Iterator
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from contextlib import contextmanager
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
 
 import click
-from PIL import Image, ImageChops
+import PIL
+from PIL import Image, ImageChops, ImageMath
 
-from ..utils.logging import get_logger
+from ..utils.logging import WorkerLogForwarder, get_logger, init_worker_logging
+
+if TYPE_CHECKING:
+    import logging
+    from multiprocessing.queues import Queue as ProcessQueue
+
+try:
+    import pyvips
+except (ImportError, OSError):  # optional fast path, see the "vips" extra
+    pyvips = None
+
+# Set once the libvips operation cache has been disabled, on first use
+_vips_configured = False
+
+
+# Name markers of normal maps: "_n.", "_normal.", "_nrm." or "_norm."
+_NORMAL_MAP_NAME = re.compile(r"_(?:n|normal|nrm|norm)\.", re.IGNORECASE)
+
+# Image formats batch conversion will pick up
+_IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.tga', '.bmp')
+
+# zlib level for PNG output: single files use zlib's default, while batch
+# conversion trades slightly larger files for much faster encoding
+_SINGLE_COMPRESS_LEVEL = 6
+_BATCH_COMPRESS_LEVEL = 1
+
+# Batches at least this large are converted on a process pool; for fewer
+# files, starting the worker processes costs more than it saves
+_PROCESS_POOL_MIN_FILES = 16
+
+# Converts one normal map in place: (path, backup, compress_level) -> output
+_ConvertFn = Callable[[Path, bool, int], "Path | None"]
+
+
+def _iter_image_files(directory: Path, pattern: str, recursive: bool) -> Iterator[Path]:
+    """Yield image files whose names match a glob pattern, in one scandir pass.
+
+    Names are checked on the directory entries themselves, so a Path is only
+    built for matches and no extra stat calls are made.
+    """
+    # Match case the way the platform's filesystem does, as pathlib.glob would
+    flags = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+    matches = re.compile(fnmatch.translate(pattern), flags).match
+
+    pending = [os.fspath(directory)]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        pending.append(entry.path)
+                elif (entry.name.lower().endswith(_IMAGE_EXTENSIONS)
+                      and matches(entry.name) and entry.is_file()):
+                    yield Path(entry.path)
 
 
 class NormalMapError(Exception):
@@ -16,6 +86,107 @@ class NormalMapError(Exception):
     pass
 
 
+def _replace_file(path: Path, payload: bytes | memoryview) -> None:
+    """Write payload to a new file and move it over path.
+
+    The old file is replaced rather than truncated, so a hardlinked backup
+    keeps the original data and an interrupted write never leaves a
+    half-written image behind.
+    """
+    # A unique temp name keeps concurrent conversions of the same file apart
+    fd, temp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    temp_path = Path(temp_name)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        if path.exists():
+            shutil.copymode(path, temp_path)
+        os.replace(temp_path, path)
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+
+def _save_image(image: Image.Image, output_path: Path,
+                compress_level: int = _SINGLE_COMPRESS_LEVEL) -> None:
+    """Encode an image in memory and write it to disk in a single call."""
+    image_format = Image.registered_extensions().get(output_path.suffix.lower())
+    if image_format is None:
+        # Let Pillow raise its usual unknown-extension error
+        image.save(output_path)
+        return
+
+    params = {"compress_level": compress_level} if image_format == "PNG" else {}
+    buffer = io.BytesIO()
+    image.save(buffer, format=image_format, **params)
+    _replace_file(output_path, buffer.getbuffer())
+
+
+def _unity_xy_bands(img: Image.Image) -> tuple[Image.Image, Image.Image]:
+    """Return the X (alpha) and Y (blue) bands of a Unity normal map.
+
+    Only the two bands that carry data are extracted, and RGBA, RGB, LA and
+    L sources are read without first converting the whole image to RGBA.
+    """
+    if img.mode == "RGBA":
+        return img.getchannel("A"), img.getchannel("B")
+
+    if img.mode == "LA":
+        # RGBA conversion would copy the luminance into blue
+        return img.getchannel("A"), img.getchannel("L")
+
+    if "transparency" not in img.info:
+        # An RGBA conversion would only add an opaque alpha band
+        if img.mode == "RGB":
+            return Image.new("L", img.size, 255), img.getchannel("B")
+        if img.mode == "L":
+            img.load()
+            return Image.new("L", img.size, 255), img
+
+    rgba = img.convert("RGBA")
+    return rgba.getchannel("A"), rgba.getchannel("B")
+
+
+def _reconstruct_z(x_channel: Image.Image, y_channel: Image.Image) -> Image.Image:
+    """Compute the Z band of a unit normal, Z = sqrt(1 - X^2 - Y^2).
+
+    The maths runs over whole float images in Pillow's C loops, so the
+    cost is a few passes over the image rather than a per-pixel loop.
+    """
+    def z_from_xy(args: dict[str, Any]) -> Any:
+        x = args["float"](args["x"]) * (2 / 255) - 1.0
+        y = args["float"](args["y"]) * (2 / 255) - 1.0
+        # Clamp before the square root; rounding can push X^2 + Y^2 past 1
+        z = args["max"](1.0 - x * x - y * y, 0.0) ** 0.5
+        # Map [0, 1] back to [128, 255], rounding rather than truncating
+        return z * 127.5 + 128.0
+
+    z_channel: Image.Image = ImageMath.lambda_eval(z_from_xy, x=x_channel, y=y_channel)
+    return z_channel.convert("L")
+
+
+def _convert_with_vips(input_path: Path, output_path: Path, compress_level: int) -> bool:
+    """Convert an 8-bit RGBA PNG with libvips; returns False if it cannot."""
+    global _vips_configured
+    if output_path.suffix.lower() != ".png":
+        return False
+
+    if not _vips_configured:
+        # Files are converted in place, so libvips must not serve a cached decode
+        pyvips.cache_set_max(0)
+        _vips_configured = True
+
+    image = pyvips.Image.new_from_file(str(input_path), access="sequential")
+    if image.bands != 4 or image.format != "uchar":
+        return False
+
+    # Same mapping as the Pillow path: R = alpha, G = blue, B = 255
+    converted = image[3].bandjoin([image[2], 255]).copy(interpretation="srgb")
+    _replace_file(output_path, converted.write_to_buffer(".png", compression=compress_level))
+    return True
+
+
 class NormalMapConverter:
     """Converts Unity normal maps to standard format."""
 
@@ -24,12 +195,10 @@ class NormalMapConverter:
 
     def is_normal_map(self, image_path: Path) -> bool:
         """Check if an image file is likely a normal map."""
-        name_lower = image_path.name.lower()
-        normal_indicators = ["_n.", "_normal.", "_nrm.", "_norm."]
-
-        return any(indicator in name_lower for indicator in normal_indicators)
+        return _NORMAL_MAP_NAME.search(image_path.name) is not None
 
-    def convert_normal_map(self, input_path: Path, output_path: Path | None = None) -> Path:
+    def convert_normal_map(self, input_path: Path, output_path: Path | None = None,
+                           compress_level: int = _SINGLE_COMPRESS_LEVEL) -> Path:
         """Convert a Unity normal map to standard format.
 
         Unity stores normal maps with:
@@ -42,31 +211,30 @@ class NormalMapConverter:
         - Red channel: X component
         - Green channel: Y component
         - Blue channel: Z component (set to neutral)
+
+        compress_level is the zlib level (0-9) used when writing PNG output.
         """
         if output_path is None:
             output_path = input_path.parent / f"{input_path.stem}_converted{input_path.suffix}"
 
         try:
-            with Image.open(input_path) as img:
-                if img.mode != "RGBA":
-                    img = img.convert("RGBA")
-
-                # Split channels
-                r, g, b, a = img.split()
+            if pyvips is not None and _convert_with_vips(input_path, output_path, compress_level):
+                self.logger.debug("Converted normal map: %s -> %s", input_path, output_path)
+                return output_path
 
+            with Image.open(input_path) as img:
                 # Convert Unity format:
                 # Red = Alpha (X component)
                 # Green = Blue (Y component, NOT inverted by default)
                 # Blue = maximum Z (255 = 1.0 in normalized space)
-                x_channel = a
-                y_channel = b  # Use blue channel as-is
-                z_channel = Image.new('L', img.size, 255)  # Use 255 for maximum Z
+                x_channel, y_channel = _unity_xy_bands(img)  # Use blue channel as-is
+                z_channel = Image.new("L", img.size, 255)  # Use 255 for maximum Z
 
                 # Merge channels
                 converted = Image.merge("RGB", (x_channel, y_channel, z_channel))
-                converted.save(output_path)
+                _save_image(converted, output_path, compress_level)
 
-                self.logger.debug(f"Converted normal map: {input_path} -> {output_path}")
+                self.logger.debug("Converted normal map: %s -> %s", input_path, output_path)
                 return output_path
 
         except Exception as e:
@@ -74,34 +242,35 @@ class NormalMapConverter:
 
     def convert_normal_map_advanced(self, input_path: Path, output_path: Path | None = None,
                                   invert_y: bool = True, calculate_z: bool = True) -> Path:
-        """Advanced normal map conversion with options (for backward compatibility)."""
+        """Advanced normal map conversion with options (for backward compatibility).
+
+        With calculate_z the Z band is reconstructed from X and Y; otherwise
+        it is filled with a flat 128.
+        """
         if output_path is None:
             output_path = input_path.parent / f"{input_path.stem}_converted{input_path.suffix}"
 
         try:
             with Image.open(input_path) as img:
-                if img.mode != "RGBA":
-                    img = img.convert("RGBA")
-
-                r, g, b, a = img.split()
-
-                x_channel = a
-                y_channel = b
+                x_channel, y_channel = _unity_xy_bands(img)
                 if invert_y:
-                    y_channel = ImageChops.invert(b)
-                z_channel = Image.new('L', img.size, 128)
+                    y_channel = ImageChops.invert(y_channel)
+                if calculate_z:
+                    z_channel = _reconstruct_z(x_channel, y_channel)
+                else:
+                    z_channel = Image.new("L", img.size, 128)
 
                 converted = Image.merge("RGB", (x_channel, y_channel, z_channel))
-                converted.save(output_path)
+                _save_image(converted, output_path)
 
                 return output_path
 
         except Exception as e:
             raise NormalMapError(f"Failed to convert {input_path}: {e}") from e
 
-    def validate_normal_map(self, image_path: Path) -> dict[str, any]:
+    def validate_normal_map(self, image_path: Path) -> dict[str, Any]:
         """Validate and analyze a normal map (simplified version)."""
-        result = {
+        result: dict[str, Any] = {
             "is_valid": False,
             "format": "unknown",  # Use "format" to match test expectations
             "format_detected": "unknown",  # Keep this for backward compatibility
@@ -122,23 +291,31 @@ class NormalMapConverter:
                     result["issues"].append(f"Unsupported mode: {img.mode}")
                     return result
 
-                # Analyze channel data to determine format
-                r, g, b, a = img.split()
+                # Per-band (min, max) from a single pass in C; an RGBA image
+                # always gives one pair per band
+                extrema = cast(tuple[tuple[int, int], ...], img.getextrema())
+                result["channels"] = {
+                    name: {"min": low, "max": high}
+                    for name, (low, high) in zip(("red", "green", "blue", "alpha"), extrema)
+                }
 
-                # Sample a few pixels to determine format
-                sample_pixels = []
+                # Sample a few pixels to determine format; the pixel access
+                # object avoids getpixel's per-call argument parsing
                 width, height = img.size
-                for y in range(0, height, height//4 or 1):
-                    for x in range(0, width, width//4 or 1):
-                        pixel = img.getpixel((x, y))
-                        sample_pixels.append(pixel)
+                pixels = img.load()
+                if pixels is None:
+                    result["issues"].append("Image has no pixel data")
+                    return result
+                sample_pixels = [
+                    pixels[x, y]
+                    for y in range(0, height, height//4 or 1)
+                    for x in range(0, width, width//4 or 1)
+                ]
 
                 if sample_pixels:
-                    # Calculate average channel values
-                    avg_r = sum(p[0] for p in sample_pixels) / len(sample_pixels)
-                    avg_g = sum(p[1] for p in sample_pixels) / len(sample_pixels)
-                    avg_b = sum(p[2] for p in sample_pixels) / len(sample_pixels)
-                    avg_a = sum(p[3] for p in sample_pixels) / len(sample_pixels)
+                    # Calculate average channel values in one pass over the samples
+                    count = len(sample_pixels)
+                    avg_r, avg_g, avg_b, avg_a = (total / count for total in map(sum, zip(*sample_pixels)))
 
                     # Unity format: data primarily in green and alpha channels
                     # Standard format: data primarily in red and green channels
@@ -162,48 +339,161 @@ class NormalMapConverter:
         return result
 
     def batch_convert_directory(self, directory: Path, recursive: bool = True,
-                              pattern: str = "*_n*.png", backup: bool = False) -> list[Path]:
-        """Convert all normal maps in a directory."""
-        # Find normal map files
-        if recursive:
-            normal_maps = list(directory.rglob(pattern))
-        else:
-            normal_maps = list(directory.glob(pattern))
-
-        # Filter to only image files
-        image_extensions = {'.png', '.jpg', '.jpeg', '.tga', '.bmp'}
-        normal_maps = [f for f in normal_maps if f.suffix.lower() in image_extensions]
-
+                              pattern: str = "*_n*.png", backup: bool = False,
+                              max_workers: int | None = None,
+                              compress_level: int = _BATCH_COMPRESS_LEVEL) -> list[Path]:
+        """Convert all normal maps in a directory.
+
+        Large batches are converted on a process pool so the channel work is
+        not serialized by the GIL; small batches, or systems where no pool can
+        be started, use a thread pool instead.
+        """
+        normal_maps = self._find_normal_maps(directory, pattern, recursive)
         if not normal_maps:
-            self.logger.info(f"No normal maps found in {directory}")
+            self.logger.info("No normal maps found in %s", directory)
             return []
 
-        self.logger.info(f"Found {len(normal_maps)} normal maps to convert")
+        self.logger.info("Found %d normal maps to convert", len(normal_maps))
+        self._log_pillow_build()
 
-        converted_files = []
+        converted = {}
+        skipped = 0
 
         with self.logger.create_task_progress() as progress:
             task = progress.add_task("Converting normal maps", total=len(normal_maps))
 
-            for normal_map in normal_maps:
+            workers = max_workers or os.cpu_count() or 1
+            with self._open_executor(len(normal_maps), workers) as (executor, convert):
+                future_to_map = {
+                    executor.submit(convert, normal_map, backup, compress_level): normal_map
+                    for normal_map in normal_maps
+                }
+
+                for future in as_completed(future_to_map):
+                    normal_map = future_to_map[future]
+                    try:
+                        output_path = future.result()
+                        if output_path is None:
+                            skipped += 1
+                        else:
+                            converted[normal_map] = output_path
+                    except Exception as e:
+                        self.logger.error("Failed to convert %s: %s", normal_map, e)
+
+                    progress.update(task, advance=1)
+
+        # Report results in discovery order rather than completion order
+        converted_files = [converted[path] for path in normal_maps if path in converted]
+
+        if skipped:
+            self.logger.info("Skipped %d normal maps already in standard format", skipped)
+
+        self.logger.info("Successfully converted %d normal maps", len(converted_files))
+        return converted_files
+
+    def batch_validate_directory(self, directory: Path, recursive: bool = True,
+                                 pattern: str = "*_n*.png",
+                                 max_workers: int | None = None) -> dict[Path, dict[str, Any]]:
+        """Validate all normal maps in a directory.
+
+        Files are validated on a thread pool, since decoding dominates and
+        Pillow releases the GIL while doing it. Results keep discovery order.
+        """
+        normal_maps = self._find_normal_maps(directory, pattern, recursive)
+        if not normal_maps:
+            self.logger.info("No normal maps found in %s", directory)
+            return {}
+
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            return dict(zip(normal_maps, executor.map(self.validate_normal_map, normal_maps)))
+
+    def _find_normal_maps(self, directory: Path, pattern: str, recursive: bool) -> list[Path]:
+        """Collect the image files in a directory that match a glob pattern."""
+        if "/" in pattern or os.sep in pattern:
+            # Patterns spanning directories still need pathlib's glob
+            found = directory.rglob(pattern) if recursive else directory.glob(pattern)
+            return [f for f in found if f.suffix.lower() in _IMAGE_EXTENSIONS]
+
+        return list(_iter_image_files(directory, pattern, recursive))
+
+    def _log_pillow_build(self) -> None:
+        """Log which Pillow build the conversion will run on."""
+        # Pillow-SIMD releases carry a ".postN" suffix on the Pillow version
+        if ".post" in PIL.__version__:
+            self.logger.debug("Using Pillow-SIMD %s", PIL.__version__)
+        else:
+            self.logger.debug("Using Pillow %s; pillow-simd can speed up conversion",
+                              PIL.__version__)
+
+    @contextmanager
+    def _open_executor(self, file_count: int,
+                       max_workers: int) -> Iterator[tuple[Executor, _ConvertFn]]:
+        """Yield an executor for a batch and the conversion callable to submit to it."""
+        if file_count >= _PROCESS_POOL_MIN_FILES and max_workers > 1:
+            context = multiprocessing.get_context("spawn")
+            try:
+                # Workers log through this process instead of opening their own log files
+                log_forwarder = WorkerLogForwarder(context)
+                executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=context,
+                                               initializer=_init_convert_worker,
+                                               initargs=log_forwarder.initargs)
+            except (OSError, NotImplementedError) as e:
+                self.logger.debug("Process pool unavailable, using threads: %s", e)
+            else:
+                with log_forwarder, executor:
+                    yield executor, _convert_in_worker
+                return
+
+        with ThreadPoolExecutor(max_workers=max_workers) as thread_executor:
+            yield thread_executor, self._convert_in_place
+
+    def _convert_in_place(self, normal_map: Path, backup: bool,
+                          compress_level: int = _BATCH_COMPRESS_LEVEL) -> Path | None:
+        """Back up a normal map if requested, then overwrite it with the converted image.
+
+        Returns None without touching the file if it carries no alpha data.
+        Unity keeps X in alpha, and converted maps are saved as RGB, so such a
+        file has already been converted (for example by an earlier run). This
+        header check stands in for validate_normal_map, which only classifies
+        RGBA images and would never report a converted map as "standard".
+        Palette or grey images with a transparency entry still hold X and
+        are converted.
+        """
+        # Opening only parses the header; pixel data is not decoded here
+        with Image.open(normal_map) as img:
+            if not img.has_transparency_data:
+                return None
+
+        if backup:
+            backup_path = normal_map.parent / f"{normal_map.stem}_backup{normal_map.suffix}"
+            if not backup_path.exists():
+                # The converted image replaces the original with a new file,
+                # so a hardlink is enough to keep the old bytes
                 try:
-                    # Create backup if requested
-                    if backup:
-                        backup_path = normal_map.parent / f"{normal_map.stem}_backup{normal_map.suffix}"
-                        if not backup_path.exists():
-                            backup_path.write_bytes(normal_map.read_bytes())
+                    os.link(normal_map, backup_path)
+                except OSError:
+                    # Filesystems without hardlinks get a real copy
+                    shutil.copy2(normal_map, backup_path)
 
-                    # Convert in place (overwrite original)
-                    output_path = self.convert_normal_map(normal_map, normal_map)
-                    converted_files.append(output_path)
+        return self.convert_normal_map(normal_map, normal_map, compress_level=compress_level)
 
-                except Exception as e:
-                    self.logger.error(f"Failed to convert {normal_map}: {e}")
 
-                progress.update(task, advance=1)
+# Converter shared by all tasks of a pool worker, built by _init_convert_worker
+_worker_converter: NormalMapConverter | None = None
 
-        self.logger.info(f"Successfully converted {len(converted_files)} normal maps")
-        return converted_files
+
+def _init_convert_worker(log_queue: ProcessQueue[logging.LogRecord], level: int) -> None:
+    """Pool initializer: route logging to the parent and build the converter once."""
+    global _worker_converter
+    init_worker_logging(log_queue, level)
+    _worker_converter = NormalMapConverter()
+
+
+def _convert_in_worker(normal_map: Path, backup: bool, compress_level: int) -> Path | None:
+    """Convert one normal map in place inside a process pool worker."""
+    if _worker_converter is None:
+        raise NormalMapError("Conversion worker was not initialized")
+    return _worker_converter._convert_in_place(normal_map, backup, compress_level)
 
 
 # CLI Interface
@@ -212,8 +502,12 @@ class NormalMapConverter:
 @click.option('--recursive', '-r', is_flag=True, help='Process directories recursively')
 @click.option('--pattern', '-p', default='*_n*.png', help='File pattern to match')
 @click.option('--backup', '-b', is_flag=True, help='Create backups before conversion')
+@click.option('--compress-level', type=click.IntRange(0, 9), default=None,
+              help='PNG zlib level (default: 6 for a file, 1 for a directory)')
+@click.option('--validate', is_flag=True, help='Only report the detected format, do not convert')
 @click.option('--verbose', '-v', is_flag=True, help='Verbose output')
-def cli_main(path: Path, recursive: bool, pattern: str, backup: bool, verbose: bool) -> None:
+def cli_main(path: Path, recursive: bool, pattern: str, backup: bool,
+             compress_level: int | None, validate: bool, verbose: bool) -> None:
     """Convert Unity normal maps to standard format.
 
     PATH can be a single image file or directory containing normal maps.
@@ -224,23 +518,39 @@ def cli_main(path: Path, recursive: bool, pattern: str, backup: bool, verbose: b
 
     converter = NormalMapConverter()
 
+    if validate:
+        if path.is_file():
+            results = {path: converter.validate_normal_map(path)}
+        else:
+            results = converter.batch_validate_directory(path, recursive=recursive, pattern=pattern)
+
+        for image_path, result in results.items():
+            if result["is_valid"]:
+                logger.info("%s: %s format", image_path, result["format"])
+            else:
+                logger.warning("%s: %s", image_path, "; ".join(result["issues"]))
+        return
+
     try:
         if path.is_file():
-            output_path = converter.convert_normal_map(path)
-            logger.info(f"Converted: {output_path}")
+            output_path = converter.convert_normal_map(
+                path, compress_level=_SINGLE_COMPRESS_LEVEL if compress_level is None else compress_level
+            )
+            logger.info("Converted: %s", output_path)
 
         elif path.is_dir():
             converted_files = converter.batch_convert_directory(
-                path, recursive=recursive, pattern=pattern, backup=backup
+                path, recursive=recursive, pattern=pattern, backup=backup,
+                compress_level=_BATCH_COMPRESS_LEVEL if compress_level is None else compress_level
             )
-            logger.info(f"Conversion complete: {len(converted_files)} files processed")
+            logger.info("Conversion complete: %d files processed", len(converted_files))
 
         else:
-            logger.error(f"Invalid path: {path}")
+            logger.error("Invalid path: %s", path)
             sys.exit(1)
 
     except Exception as e:
-        logger.error(f"Conversion failed: {e}")
+        logger.error("Conversion failed: %s", e)
         sys.exit(1)
 
 
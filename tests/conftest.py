@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import tempfile
 from pathlib import Path
 from collections.abc import Generator
@@ -12,6 +13,18 @@ from wog_dump.core.config import WOGConfig, reset_config
 from wog_dump.core.storage import DataStorageManager
 
 
+@pytest.fixture(autouse=True, scope="session")
+def isolated_work_dir(tmp_path_factory: pytest.TempPathFactory) -> Generator[Path, None, None]:
+    """Run the session from a temporary directory so log files stay out of the repo."""
+    work_dir = tmp_path_factory.mktemp("work")
+    previous_dir = Path.cwd()
+    os.chdir(work_dir)
+    try:
+        yield work_dir
+    finally:
+        os.chdir(previous_dir)
+
+
 @pytest.fixture
 def temp_dir() -> Generator[Path, None, None]:
     """Create a temporary directory for tests."""
@@ -25,6 +25,7 @@ class TestWOGConfig:
         assert config.weapons_file == temp_dir / "runtime" / "weapons.txt"
         assert config.keys_file == temp_dir / "runtime" / "keys.txt"
         assert config.max_threads == 4
+        assert config.chunk_size == 65536
         assert config.game_version == "2.2.1z5"
         assert config.unity_version == "2019.2.18f1"
     
@@ -62,6 +63,22 @@ class TestWOGConfig:
         assert "shooting_01" in blacklist  # From texture blacklist
         assert len(blacklist) > 0
     
+    def test_is_blacklisted(self, temp_dir: Path) -> None:
+        """Test case-insensitive blacklist lookup."""
+        config = WOGConfig(base_dir=temp_dir)
+        
+        assert config.is_blacklisted("HK_G28")
+        assert config.is_blacklisted("shooting_01")
+        assert not config.is_blacklisted("ak47")
+        
+        # Reassigned and in-place modified lists are both honoured
+        config.weapon_blacklist = ["AK47"]
+        assert config.is_blacklisted("ak47")
+        assert not config.is_blacklisted("hk_g28")
+
+        config.weapon_blacklist.append("m4a1")
+        assert config.is_blacklisted("M4A1")
+    
     def test_max_threads_validation(self, temp_dir: Path) -> None:
         """Test max_threads validation."""
         # Valid values
@@ -75,6 +92,14 @@ class TestWOGConfig:
         with pytest.raises(ValueError):
             WOGConfig(base_dir=temp_dir, max_threads=20)
 
+    def test_png_compress_level_validation(self, temp_dir: Path) -> None:
+        """Test png_compress_level validation."""
+        config = WOGConfig(base_dir=temp_dir)
+        assert config.png_compress_level == 6
+
+        with pytest.raises(ValueError):
+            WOGConfig(base_dir=temp_dir, png_compress_level=10)
+
 
 class TestConfigManagement:
     """Test global configuration management."""
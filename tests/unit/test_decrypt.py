@@ -53,6 +53,16 @@ class TestKeyManager:
         
         with pytest.raises(DecryptionError):
             manager.save_keys({"test": "key"})
+    
+    def test_request_payload_round_trip(self, test_config: WOGConfig) -> None:
+        """Test that compressed request data carries its length prefix."""
+        manager = KeyManager(test_config)
+        data = manager._build_api_request_data("test_weapon")
+        
+        payload = manager._compress_request_data(data)
+        
+        assert int.from_bytes(payload[:4], "little") == len(payload) - 4
+        assert manager._decompress_response(payload) == data
 
 
 class TestAssetDecryptor:
@@ -107,6 +117,28 @@ class TestAssetDecryptor:
             # Should match original data
             assert decrypted_path.read_bytes() == test_data
     
+    def test_decrypt_with_python_across_chunks(self, test_config: WOGConfig) -> None:
+        """Test that the key stream continues correctly across read chunks."""
+        decryptor = AssetDecryptor(test_config)
+        key = "test_key"
+        key_bytes = decryptor.generate_decryption_key(key).encode("utf-8")
+        
+        # Not a multiple of the chunk size or of the key length
+        test_data = bytes(range(256)) * 100 + b"tail"
+        expected = bytes(b ^ key_bytes[i % len(key_bytes)] for i, b in enumerate(test_data))
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            input_path = temp_path / "input.bin"
+            output_path = temp_path / "output.bin"
+            input_path.write_bytes(test_data)
+            
+            assert decryptor.decrypt_with_python(input_path, key, output_path) is True
+            assert output_path.read_bytes() == expected
+        
+        assert decryptor.xor_decrypt(test_data, decryptor.generate_decryption_key(key)) == expected
+        assert decryptor.xor_decrypt(b"", "key") == b""
+    
     def test_decrypt_asset_with_bytes_m_script(self, test_config: WOGConfig) -> None:
         """Test decrypting asset when m_Script is bytes."""
         # Mock UnityPy objects
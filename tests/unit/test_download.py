@@ -43,6 +43,20 @@ class TestDownloadManager:
         assert size == 1024
         mock_head.assert_called_once()
     
+    @patch('wog_dump.core.download.requests.Session.head')
+    def test_get_asset_size_cached(self, mock_head: Mock, test_config: WOGConfig) -> None:
+        """Test that a known asset size is not requested twice."""
+        mock_response = Mock()
+        mock_response.headers = {"Content-Length": "1024"}
+        mock_response.raise_for_status.return_value = None
+        mock_head.return_value = mock_response
+        
+        with DownloadManager(test_config) as manager:
+            assert manager.get_asset_size("test_asset") == 1024
+            assert manager.get_asset_size("test_asset") == 1024
+        
+        mock_head.assert_called_once()
+    
     @patch('wog_dump.core.download.requests.Session.head')
     def test_get_asset_size_failure(self, mock_head: Mock, test_config: WOGConfig) -> None:
         """Test getting asset size with network error."""
@@ -187,6 +201,19 @@ class TestDownloadManager:
         # Check that all weapons are present regardless of order (parallel processing)
         assert set(to_download) == set(sample_weapon_list)
     
+    def test_check_for_updates_uses_local_sizes(self, test_config: WOGConfig) -> None:
+        """Test that only assets present locally are checked against the server."""
+        (test_config.assets_dir / "same.unity3d").write_bytes(b"test data")
+        (test_config.assets_dir / "changed.unity3d").write_bytes(b"old")
+        
+        with DownloadManager(test_config) as manager:
+            manager.get_asset_size = Mock(return_value=len(b"test data"))
+            
+            to_download = manager.check_for_updates(["same", "changed", "missing"])
+        
+        assert set(to_download) == {"changed", "missing"}
+        assert {call.args[0] for call in manager.get_asset_size.call_args_list} == {"same", "changed"}
+    
     def test_download_assets_no_updates(self, test_config: WOGConfig, sample_weapon_list: list[str]) -> None:
         """Test downloading assets when no updates are needed."""
         with DownloadManager(test_config) as manager:
@@ -196,4 +223,27 @@ class TestDownloadManager:
             successful, failed = manager.download_assets(sample_weapon_list)
         
         assert successful == []
-        assert failed == []
\ No newline at end of file
+        assert failed == []
+    
+    def test_download_assets_parallel_keeps_order(self, test_config: WOGConfig, sample_weapon_list: list[str]) -> None:
+        """Test that parallel downloads report results in the requested order."""
+        with DownloadManager(test_config) as manager:
+            failing = set(sample_weapon_list[1::2])
+            manager.download_single_asset = Mock(side_effect=lambda weapon: weapon not in failing)
+            
+            successful, failed = manager.download_assets(sample_weapon_list, check_updates=False)
+        
+        assert successful == [w for w in sample_weapon_list if w not in failing]
+        assert failed == [w for w in sample_weapon_list if w in failing]
+        assert manager.download_single_asset.call_count == len(sample_weapon_list)
+
+    def test_download_assets_skips_duplicates(self, test_config: WOGConfig) -> None:
+        """Test that a weapon listed twice is downloaded once."""
+        with DownloadManager(test_config) as manager:
+            manager.download_single_asset = Mock(return_value=True)
+
+            successful, failed = manager.download_assets(["ak47", "m4a1", "ak47"], check_updates=False)
+
+        assert successful == ["ak47", "m4a1"]
+        assert failed == []
+        assert manager.download_single_asset.call_count == 2
@@ -0,0 +1,78 @@
+"""Unit tests for logging module."""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+
+from wog_dump.utils.logging import LoggerManager, _BufferedFileHandler
+
+
+def _record(level: int, message: str) -> logging.LogRecord:
+    return logging.LogRecord("wog_dump", level, __file__, 1, message, None, None)
+
+
+class TestBufferedFileHandler:
+    """Test _BufferedFileHandler class."""
+
+    def test_close_writes_buffered_records(self, temp_dir: Path) -> None:
+        """Test that records held in the buffer reach the file on close."""
+        log_file = temp_dir / "test.log"
+        handler = _BufferedFileHandler(log_file, encoding="utf-8")
+        handler._last_flush = float("inf")
+
+        handler.emit(_record(logging.INFO, "buffered"))
+        assert log_file.read_text(encoding="utf-8") == ""
+
+        handler.close()
+        assert log_file.read_text(encoding="utf-8") == "buffered\n"
+
+    def test_error_is_written_immediately(self, temp_dir: Path) -> None:
+        """Test that ERROR records are flushed without waiting for the interval."""
+        log_file = temp_dir / "test.log"
+        handler = _BufferedFileHandler(log_file, encoding="utf-8")
+        handler._last_flush = float("inf")
+
+        try:
+            handler.emit(_record(logging.INFO, "before"))
+            handler.emit(_record(logging.ERROR, "failed"))
+            assert log_file.read_text(encoding="utf-8") == "before\nfailed\n"
+        finally:
+            handler.close()
+
+    def test_flush_after_interval(self, temp_dir: Path) -> None:
+        """Test that buffered records reach the file once the interval has passed."""
+        log_file = temp_dir / "test.log"
+        handler = _BufferedFileHandler(log_file, encoding="utf-8")
+        handler.flush_interval = 0.0
+
+        try:
+            handler.emit(_record(logging.INFO, "timed"))
+            assert log_file.read_text(encoding="utf-8") == "timed\n"
+        finally:
+            handler.close()
+
+
+class TestLoggerManager:
+    """Test LoggerManager class."""
+
+    def test_reset_logger_closes_instance(self) -> None:
+        """Test that resetting stops the old listener and closes its log file."""
+        LoggerManager.reset_logger()
+        old_logger = LoggerManager.get_logger()
+        listener = old_logger._listener
+        file_handler = old_logger._file_handler
+        assert listener is not None and file_handler is not None
+
+        LoggerManager.reset_logger()
+
+        assert listener._thread is None
+        assert file_handler.stream is None
+        assert not old_logger.logger.handlers
+
+        new_logger = LoggerManager.get_logger()
+        try:
+            assert new_logger._listener is not None
+            assert len(new_logger.logger.handlers) == 2
+        finally:
+            LoggerManager.reset_logger()
@@ -113,6 +113,17 @@ class TestNormalMapConverter:
         converted_img = Image.open(output_path)
         assert converted_img.mode == "RGB"
     
+    def test_convert_normal_map_luminance_alpha(self, temp_dir: Path) -> None:
+        """Test converting an LA image matches converting it as RGBA."""
+        converter = NormalMapConverter()
+
+        input_path = temp_dir / "test_la.png"
+        Image.new("LA", (8, 8), (90, 200)).save(input_path)
+
+        output_path = converter.convert_normal_map(input_path)
+
+        assert Image.open(output_path).getpixel((0, 0)) == (200, 90, 255)
+
     def test_convert_normal_map_failure(self, temp_dir: Path) -> None:
         """Test normal map conversion failure."""
         converter = NormalMapConverter()
@@ -123,6 +134,24 @@ class TestNormalMapConverter:
         with pytest.raises(NormalMapError):
             converter.convert_normal_map(input_path)
     
+    def test_convert_normal_map_vips(self, temp_dir: Path) -> None:
+        """Test the libvips path, including repeated in-place conversion."""
+        pyvips = pytest.importorskip("pyvips")
+        converter = NormalMapConverter()
+
+        normal_map = temp_dir / "vips_n.png"
+        Image.new("RGBA", (16, 16), (0, 100, 150, 200)).save(normal_map)
+        converter.convert_normal_map(normal_map, normal_map)
+
+        assert pyvips.cache_get_max() == 0
+        assert Image.open(normal_map).getpixel((0, 0)) == (200, 150, 255)
+
+        # A second source written to the same path must not hit a cached decode
+        Image.new("RGBA", (16, 16), (0, 50, 60, 70)).save(normal_map)
+        converter.convert_normal_map(normal_map, normal_map)
+
+        assert Image.open(normal_map).getpixel((0, 0)) == (70, 60, 255)
+
     def test_convert_normal_map_advanced(self, temp_dir: Path) -> None:
         """Test advanced normal map conversion with options."""
         converter = NormalMapConverter()
@@ -143,6 +172,37 @@ class TestNormalMapConverter:
         converted_img = Image.open(output_path)
         pixel = converted_img.getpixel((0, 0))
         assert pixel[1] == 150  # Should be original blue value, not inverted
+
+    def test_convert_normal_map_compress_level(self, temp_dir: Path) -> None:
+        """Test that the PNG compression level is applied to the output."""
+        converter = NormalMapConverter()
+
+        input_path = temp_dir / "test_compress_n.png"
+        Image.new("RGBA", (64, 64), (0, 100, 150, 200)).save(input_path)
+
+        stored = converter.convert_normal_map(input_path, temp_dir / "stored.png", compress_level=0)
+        packed = converter.convert_normal_map(input_path, temp_dir / "packed.png", compress_level=9)
+
+        assert stored.stat().st_size > packed.stat().st_size
+        assert Image.open(stored).tobytes() == Image.open(packed).tobytes()
+
+    def test_convert_normal_map_advanced_calculate_z(self, temp_dir: Path) -> None:
+        """Test Z reconstruction from the X and Y components."""
+        converter = NormalMapConverter()
+
+        input_path = temp_dir / "test_z.png"
+        # X = 255 is a fully tilted normal, X = 128 is close to flat
+        img = Image.new("RGBA", (2, 1), (0, 0, 128, 128))
+        img.putpixel((1, 0), (0, 0, 128, 255))
+        img.save(input_path)
+
+        output_path = converter.convert_normal_map_advanced(
+            input_path, invert_y=False, calculate_z=True
+        )
+
+        converted_img = Image.open(output_path)
+        assert converted_img.getpixel((0, 0))[2] == 255
+        assert converted_img.getpixel((1, 0))[2] == 128
     
     def test_batch_convert_directory_empty(self, temp_dir: Path) -> None:
         """Test batch conversion on empty directory."""
@@ -167,13 +227,55 @@ class TestNormalMapConverter:
         Image.new("RGB", (16, 16)).save(other_img)
         
         # Mock the actual conversion to avoid file operations
-        converter.convert_normal_map = Mock(side_effect=lambda src, dst=None: dst or src.parent / f"{src.stem}_converted{src.suffix}")
+        converter.convert_normal_map = Mock(side_effect=lambda src, dst=None, **kwargs: dst or src.parent / f"{src.stem}_converted{src.suffix}")
         
         converted_files = converter.batch_convert_directory(temp_dir)
         
         assert len(converted_files) == 3
         assert converter.convert_normal_map.call_count == 3
     
+    def test_batch_convert_skips_converted(self, temp_dir: Path) -> None:
+        """Test that already converted (RGB) normal maps are left alone."""
+        converter = NormalMapConverter()
+        
+        Image.new("RGBA", (16, 16), (0, 100, 150, 200)).save(temp_dir / "unity_n.png")
+        Image.new("RGB", (16, 16), (200, 150, 255)).save(temp_dir / "done_n.png")
+        
+        converter.convert_normal_map = Mock(side_effect=lambda src, dst=None, **kwargs: dst)
+        
+        converted_files = converter.batch_convert_directory(temp_dir)
+        
+        assert converted_files == [temp_dir / "unity_n.png"]
+        converter.convert_normal_map.assert_called_once()
+    
+    def test_batch_convert_palette_transparency(self, temp_dir: Path) -> None:
+        """Test that palette maps with a transparency entry are still converted."""
+        converter = NormalMapConverter()
+
+        normal_map = temp_dir / "palette_n.png"
+        img = Image.new("P", (16, 16), 1)
+        img.putpalette([0, 0, 0, 0, 100, 150])
+        img.save(normal_map, transparency=bytes([255, 200]))
+
+        converted_files = converter.batch_convert_directory(temp_dir)
+
+        assert converted_files == [normal_map]
+        assert Image.open(normal_map).getpixel((0, 0)) == (200, 150, 255)
+
+    def test_batch_convert_backup_keeps_original(self, temp_dir: Path) -> None:
+        """Test that the backup keeps the original data after in-place conversion."""
+        converter = NormalMapConverter()
+
+        normal_map = temp_dir / "rock_n.png"
+        Image.new("RGBA", (16, 16), (0, 100, 150, 200)).save(normal_map)
+        original = normal_map.read_bytes()
+
+        converted_files = converter.batch_convert_directory(temp_dir, backup=True)
+
+        assert converted_files == [normal_map]
+        assert (temp_dir / "rock_n_backup.png").read_bytes() == original
+        assert Image.open(normal_map).getpixel((0, 0)) == (200, 150, 255)
+
     def test_batch_convert_recursive(self, temp_dir: Path) -> None:
         """Test recursive batch conversion."""
         converter = NormalMapConverter()
@@ -217,6 +319,8 @@ class TestNormalMapConverter:
         assert result["format"] == "unity"
         assert result["mode"] == "RGBA"
         assert "channels" in result
+        assert result["channels"]["green"] == {"min": 120, "max": 120}
+        assert result["channels"]["alpha"] == {"min": 180, "max": 180}
     
     def test_validate_normal_map_standard_format(self, temp_dir: Path) -> None:
         """Test validation of standard format normal map."""
@@ -236,6 +340,20 @@ class TestNormalMapConverter:
         assert result["is_valid"] is True
         assert result["format"] == "standard"
     
+    def test_batch_validate_directory(self, temp_dir: Path) -> None:
+        """Test validating every normal map in a directory."""
+        converter = NormalMapConverter()
+
+        Image.new("RGBA", (16, 16), (10, 120, 20, 180)).save(temp_dir / "unity_n.png")
+        Image.new("L", (16, 16), 128).save(temp_dir / "gray_n.png")
+        Image.new("RGBA", (16, 16)).save(temp_dir / "diffuse.png")
+
+        results = converter.batch_validate_directory(temp_dir)
+
+        assert set(results) == {temp_dir / "unity_n.png", temp_dir / "gray_n.png"}
+        assert results[temp_dir / "unity_n.png"]["format"] == "unity"
+        assert results[temp_dir / "gray_n.png"]["is_valid"] is False
+
     def test_validate_normal_map_invalid(self, temp_dir: Path) -> None:
         """Test validation of invalid normal map."""
         converter = NormalMapConverter()
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
@@ -147,6 +148,35 @@ class TestDataStorageManager:
         backup_file = test_storage.data_file.with_suffix('.json.bak')
         assert backup_file.exists()
         
+    def test_backup_holds_previous_version(self, test_storage: DataStorageManager, sample_weapon_list: list[str]) -> None:
+        """Test that the backup keeps the document replaced by the last save."""
+        test_storage.save_weapons(sample_weapon_list)
+        test_storage.save_weapons(sample_weapon_list + ["additional_weapon"])
+        
+        backup_file = test_storage.data_file.with_suffix('.json.bak')
+        with open(backup_file, 'r', encoding='utf-8') as f:
+            assert json.load(f)["weapons"]["count"] == len(sample_weapon_list)
+        
+        with open(test_storage.data_file, 'r', encoding='utf-8') as f:
+            assert json.load(f)["weapons"]["count"] == len(sample_weapon_list) + 1
+        
+        assert not list(test_storage.data_file.parent.glob("*.tmp"))
+        
+    def test_concurrent_saves(self, test_config: WOGConfig, sample_weapon_list: list[str]) -> None:
+        """Test that managers saving at the same time do not clash on temp files."""
+        managers = [DataStorageManager(test_config) for _ in range(4)]
+        
+        def save_repeatedly(storage: DataStorageManager) -> None:
+            for _ in range(10):
+                storage.save_weapons(sample_weapon_list)
+        
+        with ThreadPoolExecutor(max_workers=len(managers)) as executor:
+            list(executor.map(save_repeatedly, managers))
+        
+        with open(managers[0].data_file, 'r', encoding='utf-8') as f:
+            assert json.load(f)["weapons"]["weapons"] == sample_weapon_list
+        assert not list(managers[0].data_file.parent.glob("*.tmp"))
+        
     def test_clear_cache(self, test_storage: DataStorageManager, sample_weapon_list: list[str], sample_keys: dict[str, str]) -> None:
         """Test cache clearing functionality."""
         # Add some data
@@ -212,6 +242,31 @@ class TestDataStorageManager:
         
         assert loaded_weapons == sample_weapon_list
         
+    def test_unchanged_file_not_reparsed(self, test_config: WOGConfig, sample_weapon_list: list[str], monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that an unchanged data file is not parsed again."""
+        DataStorageManager(test_config).save_weapons(sample_weapon_list)
+        
+        def fail_parse(payload: bytes) -> None:
+            raise AssertionError("data file parsed again")
+        
+        monkeypatch.setattr("wog_dump.core.storage._load_json", fail_parse)
+        
+        assert DataStorageManager(test_config).get_weapons() == sample_weapon_list
+        
+    def test_external_change_is_reloaded(self, test_config: WOGConfig, sample_weapon_list: list[str]) -> None:
+        """Test that a data file rewritten by someone else is parsed again."""
+        storage1 = DataStorageManager(test_config)
+        storage1.save_weapons(sample_weapon_list)
+        
+        with open(storage1.data_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        data["weapons"]["weapons"] = ["external_weapon"]
+        with open(storage1.data_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        
+        storage2 = DataStorageManager(test_config)
+        assert storage2.get_weapons() == ["external_weapon"]
+        
     def test_json_format_integrity(self, test_storage: DataStorageManager, sample_weapon_list: list[str], sample_keys: dict[str, str]) -> None:
         """Test JSON format is properly structured."""
         test_storage.save_weapons(sample_weapon_list)
@@ -0,0 +1,36 @@
+"""Unit tests for unpack module."""
+
+from __future__ import annotations
+
+from wog_dump.core.config import WOGConfig
+from wog_dump.core.unpack import WeaponListProcessor
+
+
+class TestWeaponListProcessor:
+    """Test WeaponListProcessor class."""
+
+    def test_parse_weapon_names(self, test_config: WOGConfig) -> None:
+        """Test parsing plain names, .png entries, comments and blank lines."""
+        processor = WeaponListProcessor(test_config)
+        text = "# banners\n\nak74.png\n  m4a1  \nglock_17.png extra\n"
+
+        assert processor._parse_weapon_names(text) == ["ak74", "m4a1", "glock_17"]
+
+    def test_parse_weapon_names_lenient_lines(self, test_config: WOGConfig) -> None:
+        """Test that names with spaces, dots or an upper-case extension are kept."""
+        processor = WeaponListProcessor(test_config)
+        text = "desert eagle\nmodel.1911\nkar_98k v2.png\nMP5.PNG\n"
+
+        assert processor._parse_weapon_names(text) == [
+            "desert eagle",
+            "model.1911",
+            "kar_98k v2",
+            "MP5",
+        ]
+
+    def test_parse_weapon_names_rejects_paths(self, test_config: WOGConfig) -> None:
+        """Test that path-like lines and invalid .png names are skipped."""
+        processor = WeaponListProcessor(test_config)
+        text = "textures/ak74\nwhat?\nbad name.png\n.png\n"
+
+        assert processor._parse_weapon_names(text) == []